@@ -7,10 +7,16 @@ This module creates detailed Horror Brain personas by:
 3. Synthesis into nuanced, human-like persona files
 """
 
-from .researcher import BrainResearcher
-from .screenplay_analyzer import ScreenplayPatternAnalyzer
-from .brain_synthesizer import BrainSynthesizer
-from .brain_builder import BrainBuilder
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing the package doesn't pull in the Anthropic SDK / PDF stack
+_LAZY = {
+    'BrainResearcher': '.researcher',
+    'ScreenplayPatternAnalyzer': '.screenplay_analyzer',
+    'BrainSynthesizer': '.brain_synthesizer',
+    'BrainBuilder': '.brain_builder',
+}
 
 __all__ = [
     'BrainResearcher',
@@ -18,3 +24,16 @@ __all__ = [
     'BrainSynthesizer',
     'BrainBuilder'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so __getattr__ isn't hit again
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
@@ -13,10 +13,29 @@ Usage:
 
 from typing import List, Optional
 from pathlib import Path
+import asyncio
+import logging
+import os
+import sys
+import tempfile
 
 from .researcher import BrainResearcher, ResearchSource, ResearchFindings
 from .screenplay_analyzer import ScreenplayPatternAnalyzer, ScreenplayAnalysis
-from .brain_synthesizer import BrainSynthesizer, BrainPersona
+from .brain_synthesizer import DEFAULT_PERSONA_CACHE_DIR, BrainSynthesizer, BrainPersona
+from services.anthropic_client import get_anthropic_client
+from services.file_io import write_text_file
+from services.llm_cache import DiskCache
+
+# Build progress goes to stdout by default, like the rest of the package's
+# output, whether or not the caller has configured logging. To silence or
+# redirect it, set this logger's level or replace its handlers.
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    _progress_handler = logging.StreamHandler(sys.stdout)
+    _progress_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_progress_handler)
 
 
 class BrainBuilder:
@@ -29,11 +48,30 @@ class BrainBuilder:
     3. Synthesis into nuanced persona file
     """
 
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize Brain Builder"""
-        self.researcher = BrainResearcher(api_key=api_key)
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        jobs: Optional[int] = None,
+        cache_dir: Optional[str] = DEFAULT_PERSONA_CACHE_DIR
+    ):
+        """
+        Initialize Brain Builder
+
+        Args:
+            api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY)
+            jobs: Worker processes for screenplay analysis (None = CPU count)
+            cache_dir: Where synthesized personas are cached (None disables caching)
+        """
+        # One client (and connection pool) shared by every phase
+        self.client = get_anthropic_client(api_key)
+        self.researcher = BrainResearcher(api_key=api_key, client=self.client)
         self.screenplay_analyzer = ScreenplayPatternAnalyzer()
-        self.synthesizer = BrainSynthesizer(api_key=api_key)
+        self.synthesizer = BrainSynthesizer(
+            api_key=api_key,
+            cache=DiskCache(cache_dir) if cache_dir else None,
+            client=self.client
+        )
+        self.jobs = jobs
 
     def build_brain(
         self,
@@ -63,69 +101,171 @@ class BrainBuilder:
             4. Analyze screenplays (if provided)
             5. Synthesize into persona
             6. Save to file (if output_path provided)
+
+        Note: Synchronous wrapper around build_brain_async(). From inside a
+              running event loop, await build_brain_async() directly.
         """
+        return asyncio.run(self.build_brain_async(
+            director_name,
+            screenplay_paths=screenplay_paths,
+            research_sources=research_sources,
+            focus_areas=focus_areas,
+            output_path=output_path
+        ))
 
-        print(f"\n🧠 Building Horror Brain 2.0: {director_name}")
-        print("=" * 60)
+    async def build_brain_async(
+        self,
+        director_name: str,
+        screenplay_paths: Optional[List[str]] = None,
+        research_sources: Optional[List[ResearchSource]] = None,
+        focus_areas: Optional[List[str]] = None,
+        output_path: Optional[str] = None
+    ) -> BrainPersona:
+        """
+        Build complete Horror Brain 2.0 persona (async)
 
-        # Phase 1: Research
-        print("\n📚 Phase 1: Deep Research")
-        print("-" * 60)
+        Research (phase 1) and screenplay analysis (phase 2) don't depend
+        on each other, so they run concurrently in worker threads. Synthesis
+        (phase 3) waits for both.
 
-        research = self.researcher.research_director(
+        Args: Same as build_brain()
+        """
+
+        header = f"\n🧠 Building Horror Brain 2.0: {director_name}\n{'=' * 60}\n\n📚 Phase 1: Deep Research"
+        if screenplay_paths:
+            header += f"\n🎬 Phase 2: Screenplay Analysis ({len(screenplay_paths)} screenplays)"
+        logger.info(f"{header}\n  Running in parallel...\n{'-' * 60}")
+
+        loop = asyncio.get_running_loop()
+        research_task = loop.run_in_executor(
+            None,
+            self._run_research,
             director_name,
-            focus_areas=focus_areas
+            research_sources,
+            focus_areas
         )
 
-        if research_sources:
-            print(f"\n  Analyzing {len(research_sources)} provided sources...")
-            research = self.researcher.analyze_sources(research, research_sources)
-            print(f"  ✓ Extracted insights from sources")
-        else:
-            print(f"\n  ⚠️  No sources provided yet")
-            print(f"  → Gather sources manually, then run:")
-            print(f"     builder.add_research_sources(research, sources)")
-
-        # Phase 2: Screenplay Analysis
-        screenplay_analysis = None
         if screenplay_paths:
-            print(f"\n🎬 Phase 2: Screenplay Analysis")
-            print("-" * 60)
-            print(f"  Analyzing {len(screenplay_paths)} screenplays...")
-
-            screenplay_analysis = self.screenplay_analyzer.analyze_multiple_screenplays(
+            screenplay_task = loop.run_in_executor(
+                None,
+                self.screenplay_analyzer.analyze_multiple_screenplays,
                 screenplay_paths,
-                director_name
+                director_name,
+                self.jobs
             )
-
-            print(f"  ✓ Identified patterns across screenplays")
+            research, screenplay_analysis = await asyncio.gather(research_task, screenplay_task)
+            logger.info("  ✓ Identified patterns across screenplays")
         else:
-            print(f"\n  ⚠️  No screenplays provided for analysis")
-            print(f"  → This is optional but highly recommended")
+            research = await research_task
+            screenplay_analysis = None
+            logger.info(
+                "\n  ⚠️  No screenplays provided for analysis\n"
+                "  → This is optional but highly recommended"
+            )
 
         # Phase 3: Synthesis
-        print(f"\n🔧 Phase 3: Brain Synthesis")
-        print("-" * 60)
-        print(f"  Generating Horror Brain 2.0 persona...")
+        logger.info(f"\n🔧 Phase 3: Brain Synthesis\n{'-' * 60}\n  Generating Horror Brain 2.0 persona...")
 
-        persona = self.synthesizer.synthesize_brain(
-            research,
-            screenplay_analysis
-        )
+        if output_path:
+            # Stream straight into the output file so writing overlaps generation
+            persona = await loop.run_in_executor(
+                None,
+                self._synthesize_to_file,
+                research,
+                screenplay_analysis,
+                output_path
+            )
+        else:
+            persona = await loop.run_in_executor(
+                None,
+                self.synthesizer.synthesize_brain,
+                research,
+                screenplay_analysis
+            )
 
-        print(f"  ✓ Synthesized comprehensive persona")
-        print(f"  Confidence: {persona.confidence_score:.2%}")
+        logger.info(f"  ✓ Synthesized comprehensive persona\n  Confidence: {persona.confidence_score:.2%}")
 
-        # Save if output path provided
         if output_path:
-            self.synthesizer.save_persona(persona, output_path)
+            self.synthesizer.report_saved(persona, output_path)
 
-        print("\n" + "=" * 60)
-        print(f"✅ Horror Brain 2.0 Complete: {director_name}")
-        print("=" * 60)
+        logger.info(f"\n{'=' * 60}\n✅ Horror Brain 2.0 Complete: {director_name}\n{'=' * 60}")
 
         return persona
 
+    def _run_research(
+        self,
+        director_name: str,
+        research_sources: Optional[List[ResearchSource]],
+        focus_areas: Optional[List[str]]
+    ) -> ResearchFindings:
+        """Phase 1: research questions + source analysis (runs in a worker thread)"""
+        research = self.researcher.research_director(
+            director_name,
+            focus_areas=focus_areas
+        )
+
+        if research_sources:
+            logger.info(f"\n  Analyzing {len(research_sources)} provided sources...")
+            research = self.researcher.analyze_sources(research, research_sources)
+            logger.info("  ✓ Extracted insights from sources")
+        else:
+            logger.info(
+                "\n  ⚠️  No sources provided yet\n"
+                "  → Gather sources manually, then run:\n"
+                "     builder.add_research_sources(research, sources)"
+            )
+
+        return research
+
+    def _synthesize_to_file(
+        self,
+        research: ResearchFindings,
+        screenplay_analysis: Optional[ScreenplayAnalysis],
+        output_path: str
+    ) -> BrainPersona:
+        """
+        Phase 3 with the persona streamed into output_path as it's generated
+
+        Skipped entirely when output_path already holds a persona built
+        from the same inputs (tracked in an <output>.meta.json sidecar).
+        """
+        fingerprint = self.synthesizer.fingerprint(research, screenplay_analysis)
+        persona = self.synthesizer.load_fresh_persona(
+            research,
+            screenplay_analysis,
+            output_path,
+            fingerprint
+        )
+        if persona:
+            logger.info("  ↺ Inputs unchanged since last build, reusing existing persona")
+            return persona
+
+        # Stream into a temp file next to output_path and only swap it in
+        # once synthesis succeeds, so a failed or interrupted rebuild
+        # leaves the previous persona untouched
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(output_path)),
+            suffix='.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                persona = self.synthesizer.synthesize_brain(
+                    research,
+                    screenplay_analysis,
+                    stream=True,
+                    output_file=f
+                )
+            os.chmod(tmp_path, 0o644)  # mkstemp creates 0600
+            # Invalidate before the swap so a new persona never pairs with stale meta
+            self.synthesizer.clear_persona_meta(output_path)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self.synthesizer.save_persona_meta(output_path, fingerprint)
+        return persona
+
     def add_research_sources(
         self,
         research: ResearchFindings,
@@ -161,14 +301,13 @@ class BrainBuilder:
               then builds fresh 2.0 brain with improvements
         """
 
-        print(f"\n🔄 Rebuilding {director_name} Brain as 2.0")
-        print("=" * 60)
+        logger.info(f"\n🔄 Rebuilding {director_name} Brain as 2.0\n{'=' * 60}")
 
         # Extract text from old brain PDF
         # NOTE: Use pdf_extractor, NOT direct Read
-        from services.pdf_extractor import PDFExtractor
+        from services.pdf_extractor import CachedPDFExtractor
 
-        extractor = PDFExtractor()
+        extractor = CachedPDFExtractor()
         old_brain_text = extractor.extract_text(old_brain_path)
 
         # Create research source from old brain
@@ -207,37 +346,45 @@ class BrainBuilder:
 
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
+        slug = director_name.replace(' ', '_')
 
         # Research report
         research_report = self.researcher.generate_research_report(research)
-        research_file = output_path / f"{director_name.replace(' ', '_')}_research_report.md"
-        with open(research_file, 'w') as f:
-            f.write(research_report)
-        print(f"✓ Saved research report: {research_file}")
+        research_file = output_path / f"{slug}_research_report.md"
+        write_text_file(research_file, research_report)
+        logger.info(f"✓ Saved research report: {research_file}")
 
         # Screenplay analysis report
         if screenplay_analysis:
             analysis_report = self.screenplay_analyzer.generate_pattern_report(screenplay_analysis)
-            analysis_file = output_path / f"{director_name.replace(' ', '_')}_screenplay_analysis.md"
-            with open(analysis_file, 'w') as f:
-                f.write(analysis_report)
-            print(f"✓ Saved screenplay analysis: {analysis_file}")
+            analysis_file = output_path / f"{slug}_screenplay_analysis.md"
+            write_text_file(analysis_file, analysis_report)
+            logger.info(f"✓ Saved screenplay analysis: {analysis_file}")
 
 
 # Example usage
 if __name__ == "__main__":
-    import sys
+    import argparse
 
-    if len(sys.argv) < 2:
-        print("Usage: python brain_builder.py <director_name> [screenplay_paths...]")
-        print("\nExample:")
-        print("  python brain_builder.py 'Jordan Peele' get_out.pdf us.pdf nope.pdf")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Build a Horror Brain 2.0 persona",
+        epilog="Example:\n  python brain_builder.py 'Jordan Peele' get_out.pdf us.pdf nope.pdf",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("director_name", help="Director/writer to build a brain for")
+    parser.add_argument("screenplay_paths", nargs="*", help="Screenplay files to analyze")
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Worker processes for screenplay analysis (default: CPU count)"
+    )
+    args = parser.parse_args()
 
-    director_name = sys.argv[1]
-    screenplay_paths = sys.argv[2:] if len(sys.argv) > 2 else None
+    director_name = args.director_name
+    screenplay_paths = args.screenplay_paths or None
 
-    builder = BrainBuilder()
+    builder = BrainBuilder(jobs=args.jobs)
 
     output_path = f"horror_brains/{director_name.replace(' ', '_')}_v2.md"
 
@@ -247,6 +394,8 @@ if __name__ == "__main__":
         output_path=output_path
     )
 
-    print(f"\n🎉 New Horror Brain 2.0 ready!")
-    print(f"   File: {output_path}")
-    print(f"   Confidence: {persona.confidence_score:.2%}")
+    logger.info(
+        f"\n🎉 New Horror Brain 2.0 ready!\n"
+        f"   File: {output_path}\n"
+        f"   Confidence: {persona.confidence_score:.2%}"
+    )
@@ -7,13 +7,136 @@ Takes:
 3. Synthesizes into comprehensive, nuanced Horror Brain 2.0 persona file
 """
 
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Optional, TextIO
 from dataclasses import dataclass
-from anthropic import Anthropic
+from bisect import bisect_right
+from pathlib import Path
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+import io
+import json
 import os
+import re
 
 from .researcher import ResearchFindings
 from .screenplay_analyzer import ScreenplayAnalysis
+from services.anthropic_client import get_anthropic_client
+from services.file_io import write_text_file
+from services.llm_cache import CacheBackend, make_cache_key
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+
+# Bump when the synthesis prompt changes so cached personas are invalidated
+PROMPT_VERSION = 1
+
+# Cached personas expire after 30 days
+CACHE_TTL_SECONDS = 30 * 86400
+
+DEFAULT_PERSONA_CACHE_DIR = str(Path.home() / ".cache" / "brain_builder" / "persona")
+
+# Model tiers for synthesis
+SYNTHESIS_MODEL = "claude-3-5-sonnet-20241022"  # Full-quality synthesis
+FAST_SYNTHESIS_MODEL = "claude-3-5-haiku-20241022"  # Low-data brains
+
+# Below this projected confidence the brain is already "Limited",
+# so the faster, cheaper tier is good enough
+LOW_CONFIDENCE_THRESHOLD = 0.5
+
+
+def _is_transient_api_error(error: BaseException) -> bool:
+    """Rate limits, overloads (529), 5xx and connection failures are worth retrying"""
+    import anthropic
+    if isinstance(error, (anthropic.RateLimitError, anthropic.APIConnectionError, anthropic.InternalServerError)):
+        return True
+    return isinstance(error, anthropic.APIStatusError) and error.status_code == 529
+
+
+_api_retry = retry(
+    retry=retry_if_exception(_is_transient_api_error),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+
+
+def default_model_policy(projected_confidence: float) -> str:
+    """Pick the synthesis model from the pre-synthesis confidence estimate"""
+    if projected_confidence < LOW_CONFIDENCE_THRESHOLD:
+        return FAST_SYNTHESIS_MODEL
+    return SYNTHESIS_MODEL
+
+
+# Prompt templates live in templates/ and are read once at import.
+# The system prompt is kept free of per-director text; the director name
+# and context are filled into the request template for the user turn.
+# (It's ~650 tokens, under the 1024-token minimum for Anthropic prompt
+# caching, so no cache_control breakpoint is set on it.)
+_TEMPLATES_DIR = Path(__file__).parent / "templates"
+_SYNTHESIS_SYSTEM_PROMPT = (_TEMPLATES_DIR / "persona_system_prompt.md").read_text(encoding='utf-8').rstrip('\n')
+_PERSONA_REQUEST_TEMPLATE = (_TEMPLATES_DIR / "persona_request.txt").read_text(encoding='utf-8').rstrip('\n')
+
+
+# Confidence tiers: a count >= THRESHOLDS[i] earns SCORES[i + 1]
+# (SCORES[0] applies below the first threshold)
+_SOURCE_THRESHOLDS = (1, 2, 5, 10, 20)
+_SOURCE_SCORES = (0.0, 0.1, 0.2, 0.3, 0.4, 0.5)
+
+_INSIGHT_THRESHOLDS = (10, 30, 50)
+_INSIGHT_SCORES = (0.0, 0.1, 0.2, 0.3)
+
+_SCREENPLAY_THRESHOLDS = (1, 2, 3)
+_SCREENPLAY_SCORES = (0.0, 0.1, 0.15, 0.2)
+
+
+def _tier_score(count: int, thresholds: tuple, scores: tuple) -> float:
+    """Look up the score for the highest threshold that count reaches"""
+    return scores[bisect_right(thresholds, count)]
+
+
+# Sections that grow with every source; compacted before synthesis
+MAX_SECTION_ITEMS = 15
+
+# Word-set Jaccard similarity at/above which two bullets count as duplicates
+NEAR_DUPLICATE_SIMILARITY = 0.7
+
+_WORD_PATTERN = re.compile(r"[a-z0-9']+")
+
+
+def _compact_section(items, max_items: Optional[int] = MAX_SECTION_ITEMS) -> list:
+    """
+    Drop near-duplicate bullets and cap the section at max_items
+
+    Items are kept in their original order; each is compared against the
+    items already kept by word-set overlap, so paraphrased quotes pulled
+    from several sources collapse to the first occurrence.
+    """
+    kept = []
+    kept_words = []
+
+    for item in items:
+        if max_items is not None and len(kept) >= max_items:
+            break
+
+        words = set(_WORD_PATTERN.findall(str(item).lower()))
+        is_duplicate = any(
+            len(words & other) / (len(words | other) or 1) >= NEAR_DUPLICATE_SIMILARITY
+            for other in kept_words
+        )
+        if not is_duplicate:
+            kept.append(item)
+            kept_words.append(words)
+
+    return kept
+
+
+def _meta_path(output_path: str) -> str:
+    """Sidecar path holding the fingerprint of a saved persona"""
+    return f"{output_path}.meta.json"
+
+
+def _bullets(items, prefix: str = "- ") -> str:
+    """Format items as a markdown list, one per line"""
+    return "\n".join(prefix + str(item) for item in items)
 
 
 @dataclass
@@ -37,16 +160,39 @@ class BrainSynthesizer:
     - Real personality (based on actual quotes/behavior)
     """
 
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize synthesizer with Anthropic API"""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[CacheBackend] = None,
+        client: Optional["Anthropic"] = None,
+        model_policy: Optional[Callable[[float], str]] = default_model_policy,
+        max_section_items: Optional[int] = MAX_SECTION_ITEMS
+    ):
+        """
+        Initialize synthesizer with Anthropic API
+
+        Args:
+            api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY)
+            cache: Optional response cache; identical prompts skip the API
+            client: Shared Anthropic client (created if not provided)
+            model_policy: Maps projected confidence (0-1) to a model name;
+                None always uses SYNTHESIS_MODEL
+            max_section_items: Cap on bullets per high-volume research
+                section in the synthesis prompt (None = no cap)
+        """
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
-        self.client = Anthropic(api_key=self.api_key)
-        self.model = "claude-3-5-sonnet-20241022"  # Use Sonnet for synthesis
+        self.client = client or get_anthropic_client(self.api_key)
+        self.model = SYNTHESIS_MODEL
+        self.model_policy = model_policy
+        self.max_section_items = max_section_items
+        self.cache = cache
 
     def synthesize_brain(
         self,
         research: ResearchFindings,
-        screenplay_analysis: Optional[ScreenplayAnalysis] = None
+        screenplay_analysis: Optional[ScreenplayAnalysis] = None,
+        stream: bool = False,
+        output_file: Optional[TextIO] = None
     ) -> BrainPersona:
         """
         Synthesize research and analysis into Horror Brain 2.0 persona
@@ -54,28 +200,108 @@ class BrainSynthesizer:
         Args:
             research: Research findings from interviews, etc.
             screenplay_analysis: Optional screenplay pattern analysis
+            stream: Stream the completion instead of waiting for all of it
+            output_file: Open file to write the persona into as it's generated
 
         Returns:
             BrainPersona with complete persona document
         """
 
+        # Confidence depends only on the inputs, so it's known up front
+        # and can pick the model tier before spending any tokens
+        confidence = self._calculate_confidence(research, screenplay_analysis)
+        model = self._select_model(confidence)
+
         # Build context for synthesis
         context = self._build_synthesis_context(research, screenplay_analysis)
 
         # Generate persona document
         persona_text = self._generate_persona_document(
             research.director_name,
-            context
+            context,
+            stream=stream,
+            output_file=output_file,
+            model=model
         )
 
-        # Calculate confidence score
+        return self._build_persona(research, screenplay_analysis, persona_text, confidence)
+
+    def fingerprint(
+        self,
+        research: ResearchFindings,
+        screenplay_analysis: Optional[ScreenplayAnalysis] = None
+    ) -> str:
+        """
+        Hash of everything that determines the synthesized persona
+
+        Same inputs, model and prompt version → same fingerprint, so an
+        existing persona on disk can be reused instead of re-synthesized.
+        """
         confidence = self._calculate_confidence(research, screenplay_analysis)
+        return make_cache_key(
+            context=self._build_synthesis_context(research, screenplay_analysis),
+            model=self._select_model(confidence),
+            system=_SYNTHESIS_SYSTEM_PROMPT,
+            v=PROMPT_VERSION
+        )
+
+    def load_fresh_persona(
+        self,
+        research: ResearchFindings,
+        screenplay_analysis: Optional[ScreenplayAnalysis],
+        output_path: str,
+        fingerprint: str
+    ) -> Optional[BrainPersona]:
+        """
+        Load the persona at output_path if its sidecar fingerprint matches
+
+        Returns:
+            BrainPersona built from the file on disk, or None if it's
+            missing or was built from different inputs
+        """
+        try:
+            with open(_meta_path(output_path), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('fingerprint') != fingerprint:
+                return None
+            with open(output_path, 'r', encoding='utf-8') as f:
+                persona_text = f.read()
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        return self._build_persona(research, screenplay_analysis, persona_text)
+
+    def save_persona_meta(self, output_path: str, fingerprint: str) -> None:
+        """Write the <output>.meta.json sidecar recording what the persona was built from"""
+        meta = {
+            'fingerprint': fingerprint,
+            'prompt_version': PROMPT_VERSION
+        }
+        write_text_file(_meta_path(output_path), json.dumps(meta, indent=2))
+
+    def clear_persona_meta(self, output_path: str) -> None:
+        """Remove the sidecar (the persona file is about to be rewritten)"""
+        Path(_meta_path(output_path)).unlink(missing_ok=True)
+
+    def _select_model(self, confidence: float) -> str:
+        """Model for this synthesis, per model_policy"""
+        return self.model_policy(confidence) if self.model_policy else self.model
+
+    def _build_persona(
+        self,
+        research: ResearchFindings,
+        screenplay_analysis: Optional[ScreenplayAnalysis],
+        persona_text: str,
+        confidence: Optional[float] = None
+    ) -> BrainPersona:
+        if confidence is None:
+            confidence = self._calculate_confidence(research, screenplay_analysis)
 
         return BrainPersona(
             director_name=research.director_name,
             persona_text=persona_text,
             confidence_score=confidence,
-            sources_used=len(research.sources),
+            sources_used=research.source_count,
             screenplays_analyzed=len(screenplay_analysis.screenplays_analyzed) if screenplay_analysis else 0
         )
 
@@ -86,167 +312,117 @@ class BrainSynthesizer:
     ) -> str:
         """Build comprehensive context for persona generation"""
 
-        context = f"""# Context for {research.director_name} Horror Brain 2.0
-
-## Research Findings
-
-### Creative Philosophy
-{chr(10).join(f'- {p}' for p in research.creative_philosophy)}
-
-### Process & Mindset
-{chr(10).join(f'- {p}' for p in research.process_insights)}
-
-### Themes & Interests
-{chr(10).join(f'- {t}' for t in research.themes_and_interests)}
-
-### Technical Preferences
-{chr(10).join(f'- {t}' for t in research.technical_preferences)}
-
-### Pet Peeves
-{chr(10).join(f'- {p}' for p in research.pet_peeves)}
-
-### Advice Given to Filmmakers
-{chr(10).join(f'- {a}' for a in research.advice_given)}
-
-### Real Quotes
-{chr(10).join(f'> {q}' for q in research.real_quotes)}
-
-### Influences
-{chr(10).join(f'- {i}' for i in research.influences)}
-"""
+        buf = io.StringIO()
+        buf.write(f"# Context for {research.director_name} Horror Brain 2.0\n\n")
+        buf.write("## Research Findings\n\n")
+        buf.write(f"### Creative Philosophy\n{_bullets(self._compact(research.creative_philosophy))}\n\n")
+        buf.write(f"### Process & Mindset\n{_bullets(self._compact(research.process_insights))}\n\n")
+        buf.write(f"### Themes & Interests\n{_bullets(self._compact(research.themes_and_interests))}\n\n")
+        buf.write(f"### Technical Preferences\n{_bullets(research.technical_preferences)}\n\n")
+        buf.write(f"### Pet Peeves\n{_bullets(research.pet_peeves)}\n\n")
+        buf.write(f"### Advice Given to Filmmakers\n{_bullets(research.advice_given)}\n\n")
+        buf.write(f"### Real Quotes\n{_bullets(self._compact(research.real_quotes), '> ')}\n\n")
+        buf.write(f"### Influences\n{_bullets(research.influences)}\n")
 
         if screenplay_analysis:
-            context += f"""
-
-## Screenplay Pattern Analysis
-
-### Screenplays Analyzed
-{chr(10).join(f'- {title}' for title in screenplay_analysis.screenplays_analyzed)}
+            structural = screenplay_analysis.structural
+            dialogue = screenplay_analysis.dialogue
+            buf.write("\n\n## Screenplay Pattern Analysis\n\n")
+            buf.write(f"### Screenplays Analyzed\n{_bullets(screenplay_analysis.screenplays_analyzed)}\n\n")
+            buf.write(
+                "### Structural Patterns\n"
+                f"- Average scene length: {structural.avg_scene_length:.1f} beats\n"
+                f"- Pacing: {structural.pacing_rhythm}\n\n"
+            )
+            buf.write(
+                "### Dialogue Style\n"
+                f"- Average length: {dialogue.avg_dialogue_length:.1f} words\n"
+                f"- Style: {dialogue.naturalism_vs_stylization}\n\n"
+            )
+            buf.write(
+                "### Character Development\n"
+                f"- Protagonist introduction: {screenplay_analysis.character.introduction_style}\n\n"
+            )
+            buf.write(f"### Notable Techniques\n{_bullets(screenplay_analysis.notable_techniques)}\n")
+
+        context = buf.getvalue()
 
-### Structural Patterns
-- Average scene length: {screenplay_analysis.structural.avg_scene_length:.1f} beats
-- Pacing: {screenplay_analysis.structural.pacing_rhythm}
-
-### Dialogue Style
-- Average length: {screenplay_analysis.dialogue.avg_dialogue_length:.1f} words
-- Style: {screenplay_analysis.dialogue.naturalism_vs_stylization}
+        return context
 
-### Character Development
-- Protagonist introduction: {screenplay_analysis.character.introduction_style}
+    @_api_retry
+    def _call_api(self, request: Dict, stream: bool = False):
+        """
+        messages.create with exponential backoff on transient errors
 
-### Notable Techniques
-{chr(10).join(f'- {tech}' for tech in screenplay_analysis.notable_techniques)}
-"""
+        The SDK's own retries are disabled for this call so backoff is
+        handled in one place.
+        """
+        return self.client.with_options(max_retries=0).messages.create(stream=stream, **request)
 
-        return context
+    def _compact(self, items) -> list:
+        """Shrink a research section for the prompt (see _compact_section)"""
+        return _compact_section(items, self.max_section_items)
 
     def _generate_persona_document(
         self,
         director_name: str,
-        context: str
+        context: str,
+        stream: bool = False,
+        output_file: Optional[TextIO] = None,
+        model: Optional[str] = None
     ) -> str:
-        """Generate comprehensive Horror Brain 2.0 persona document"""
-
-        prompt = f"""You are creating a Horror Brain 2.0 persona file for {director_name}.
-
-This persona will be used to provide screenplay feedback as if {director_name} were reviewing it.
-
-CRITICAL REQUIREMENTS FOR HORROR BRAIN 2.0:
-1. **More human-like, less dogmatic** - Real directors are flexible, not rigid
-2. **Context-aware** - Understand scene purpose (setup, payoff, breather, etc.)
-3. **Balanced feedback** - Praise what works, not just criticism
-4. **Nuanced** - "I usually care about X, but in this case Y might be more important"
-5. **Based on real person** - Use their actual quotes, philosophy, patterns
-
-AVOID HORROR BRAIN 1.0 MISTAKES:
-- ❌ Demanding theme in EVERY scene (real directors know some scenes are just functional)
-- ❌ Being dogmatic about rules (real directors break their own rules situationally)
-- ❌ Only criticizing (real directors praise good work too)
-- ❌ Generic advice (be specific to this director's actual style)
-
-Using this research and analysis:
-
-{context}
-
-Generate a comprehensive Horror Brain 2.0 persona document following this structure:
-
-```markdown
-# {director_name} Horror Brain 2.0
-
-## Core Identity
-
-[Brief description of who they are as a filmmaker - 2-3 sentences capturing their essence]
-
-## Creative Philosophy
-
-[What fundamentally drives their creative choices - drawn from research]
-
-## Core Values
-
-[What they truly care about in storytelling - prioritized list]
-
-## Process & Mindset
-
-[How they think about filmmaking, their approach to the craft]
-
-## Structural Preferences
-
-[Patterns from their actual work - pacing, structure, act breaks]
-
-## Character Development Approach
-
-[How they build characters, what they look for]
-
-## Thematic Integration
-
-[How they handle themes - NUANCED, not dogmatic]
-[Note: They know not every scene needs deep themes - some scenes are functional]
-
-## Dialogue Philosophy
-
-[Their approach to dialogue - style, length, purpose]
-
-## What Excites Them
-
-[What makes them passionate about a project or scene]
-
-## What Concerns Them
-
-[Red flags, warning signs, things that worry them in a script]
-
-## Flexibility & Nuance
-
-[When they break their own rules]
-[What matters vs what doesn't in different contexts]
-[How they adapt to the needs of the story]
-
-## Feedback Style
-
-[How they give notes - tone, specificity, teaching approach]
-[Balance of praise and criticism]
-
-## Real Quotes & Examples
-
-[Actual things they've said, with context]
-[Examples from their own work to reference]
-
-## Persona Prompt
+        """
+        Generate comprehensive Horror Brain 2.0 persona document
 
-[Instructions for AI to embody this persona when reviewing]
-[Tone: Professional but warm, honest but encouraging]
-[Context-awareness: Understand what the scene is trying to do]
-[Flexibility: Adapt feedback to scene purpose]
-```
+        With stream=True, text chunks are written to output_file as they
+        arrive, so the disk write overlaps generation.
+        """
+        model = model or self.model
 
-Generate the complete persona document now. Make it comprehensive, nuanced, and truly capture {director_name}'s voice and approach."""
+        user_prompt = _PERSONA_REQUEST_TEMPLATE.format(
+            director_name=director_name,
+            context=context
+        )
 
-        response = self.client.messages.create(
-            model=self.model,
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(
+                model=model,
+                system=_SYNTHESIS_SYSTEM_PROMPT,
+                prompt=user_prompt,
+                v=PROMPT_VERSION
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if output_file is not None:
+                    output_file.write(cached['text'])
+                return cached['text']
+
+        request = dict(
+            model=model,
             max_tokens=8000,
-            messages=[{"role": "user", "content": prompt}]
+            system=_SYNTHESIS_SYSTEM_PROMPT,
+            messages=[{"role": "user", "content": user_prompt}]
         )
 
-        persona_text = response.content[0].text
+        if stream:
+            chunks = []
+            # Retries cover opening the stream; once text has been written
+            # a mid-stream failure propagates rather than duplicating output
+            for event in self._call_api(request, stream=True):
+                if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                    chunks.append(event.delta.text)
+                    if output_file is not None:
+                        output_file.write(event.delta.text)
+            persona_text = "".join(chunks)
+        else:
+            response = self._call_api(request)
+            persona_text = response.content[0].text
+            if output_file is not None:
+                output_file.write(persona_text)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, {"text": persona_text}, ttl=CACHE_TTL_SECONDS)
 
         return persona_text
 
@@ -264,44 +440,16 @@ Generate the complete persona document now. Make it comprehensive, nuanced, and
         0.4 = Limited (few sources, no screenplay analysis)
         """
 
-        score = 0.0
-
         # Sources contribute up to 0.5
-        source_count = len(research.sources)
-        if source_count >= 20:
-            score += 0.5
-        elif source_count >= 10:
-            score += 0.4
-        elif source_count >= 5:
-            score += 0.3
-        elif source_count >= 2:
-            score += 0.2
-        elif source_count >= 1:
-            score += 0.1
+        score = _tier_score(research.source_count, _SOURCE_THRESHOLDS, _SOURCE_SCORES)
 
         # Quality of research contributes up to 0.3
-        insight_count = (
-            len(research.creative_philosophy) +
-            len(research.process_insights) +
-            len(research.themes_and_interests) +
-            len(research.real_quotes)
-        )
-        if insight_count >= 50:
-            score += 0.3
-        elif insight_count >= 30:
-            score += 0.2
-        elif insight_count >= 10:
-            score += 0.1
+        score += _tier_score(research.insight_count, _INSIGHT_THRESHOLDS, _INSIGHT_SCORES)
 
         # Screenplay analysis contributes up to 0.2
         if screenplay_analysis:
             screenplay_count = len(screenplay_analysis.screenplays_analyzed)
-            if screenplay_count >= 3:
-                score += 0.2
-            elif screenplay_count >= 2:
-                score += 0.15
-            elif screenplay_count >= 1:
-                score += 0.1
+            score += _tier_score(screenplay_count, _SCREENPLAY_THRESHOLDS, _SCREENPLAY_SCORES)
 
         return min(score, 1.0)
 
@@ -311,9 +459,16 @@ Generate the complete persona document now. Make it comprehensive, nuanced, and
         output_path: str
     ) -> None:
         """Save persona to file"""
-        with open(output_path, 'w') as f:
-            f.write(persona.persona_text)
+        write_text_file(output_path, persona.persona_text)
 
+        self.report_saved(persona, output_path)
+
+    def report_saved(
+        self,
+        persona: BrainPersona,
+        output_path: str
+    ) -> None:
+        """Print summary for a persona that has been written to disk"""
         print(f"✓ Saved {persona.director_name} Horror Brain 2.0 to {output_path}")
         print(f"  Confidence: {persona.confidence_score:.2%}")
         print(f"  Sources: {persona.sources_used}")
@@ -5,13 +5,18 @@ Parses ChatGPT Deep Research reports and converts them into
 ResearchFindings that Brain Builder can use.
 """
 
-from typing import Dict, List, Optional
-from anthropic import Anthropic
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from collections import Counter
+from datetime import datetime
 import os
-import json
+import re
 import sys
+import time
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
@@ -19,11 +24,77 @@ try:
     from researcher import ResearchFindings, ResearchSource
 except ImportError:
     # Fallback for when run as script
-    from pathlib import Path
-    import sys
     sys.path.append(str(Path(__file__).parent.parent))
     from brain_builder.researcher import ResearchFindings, ResearchSource
 
+backend_path = Path(__file__).parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from services import fast_json
+from services.anthropic_client import get_anthropic_client
+from services.file_io import write_text_file
+from services.json_extract import JSONStreamScanner, extract_first_json_object
+from services.llm_cache import DiskCache, make_cache_key
+
+# Bump when the parse prompt changes so cached parses are invalidated
+PARSE_PROMPT_VERSION = 2
+
+# Imported sources carry key points, not full text; cap them at ingestion
+# so later serialization and prompts never rescan oversized content
+MAX_SOURCE_CONTENT_CHARS = 2000
+
+_TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# Deep Research prompt, split once at import around its {director_name}
+# slots so generating a prompt is a single join
+_RESEARCH_PROMPT_PARTS = tuple(
+    (_TEMPLATES_DIR / "deep_research_prompt.txt").read_text(encoding='utf-8').split("{director_name}")
+)
+
+# Static parse instructions, sent as the system prompt so only the report
+# varies between calls. (At ~500 tokens they're under the 1024-token
+# prompt caching minimum, so no cache_control is set.)
+_PARSE_INSTRUCTIONS = """You parse ChatGPT Deep Research reports about a director/writer into structured data.
+
+Extract:
+1. All sources (with URLs if provided)
+2. Creative philosophy insights
+3. Process and mindset insights
+4. Themes and interests
+5. Technical preferences
+6. Pet peeves
+7. Advice given to filmmakers
+8. Real quotes (verbatim, with source attribution)
+9. Influences
+
+Return as JSON:
+{
+  "sources": [
+    {
+      "url": "URL or citation",
+      "title": "Source title",
+      "type": "commentary/interview/analysis/social",
+      "key_points": ["point 1", "point 2"]
+    }
+  ],
+  "creative_philosophy": ["insight 1", "insight 2", ...],
+  "process_insights": ["insight 1", "insight 2", ...],
+  "themes_and_interests": ["theme 1", "theme 2", ...],
+  "technical_preferences": ["preference 1", "preference 2", ...],
+  "pet_peeves": ["peeve 1", "peeve 2", ...],
+  "advice_given": ["advice 1", "advice 2", ...],
+  "real_quotes": [
+    "Quote 1 - Source",
+    "Quote 2 - Source"
+  ],
+  "influences": ["influence 1", "influence 2", ...]
+}
+
+Be comprehensive - extract ALL insights and quotes."""
+
+DEFAULT_PARSE_CACHE_DIR = str(Path.home() / ".cache" / "brain_builder" / "parse")
+
 
 class DeepResearchImporter:
     """
@@ -33,11 +104,25 @@ class DeepResearchImporter:
     structures it into ResearchFindings for Brain Builder.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize importer"""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = DEFAULT_PARSE_CACHE_DIR,
+        client: Optional["Anthropic"] = None
+    ):
+        """
+        Initialize importer
+
+        Args:
+            api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY)
+            cache_dir: Where parsed reports are cached (None disables caching)
+            client: Anthropic client (defaults to the shared per-key client,
+                so importers for many directors reuse one connection pool)
+        """
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
-        self.client = Anthropic(api_key=self.api_key)
+        self.client = client or get_anthropic_client(self.api_key)
         self.model = "claude-3-5-sonnet-20241022"
+        self.cache = DiskCache(cache_dir) if cache_dir else None
 
     def generate_research_prompt(self, director_name: str) -> str:
         """
@@ -50,91 +135,8 @@ class DeepResearchImporter:
             Formatted prompt ready to paste into ChatGPT Deep Research
         """
 
-        prompt = f"""I need deep research on {director_name}'s filmmaking process, philosophy, and creative approach for building an AI reviewer persona.
-
-RESEARCH FOCUS AREAS:
-
-1. Creative Philosophy & Process
-   - What drives their creative choices?
-   - How do they think about storytelling?
-   - What makes them passionate about a project?
-   - Their approach to the craft of filmmaking
-
-2. Themes & Interests
-   - What themes do they consistently explore?
-   - What subjects fascinate them?
-   - How do they integrate themes into their work?
-   - Balance of entertainment vs deeper meaning
-
-3. Technical Preferences
-   - Structural patterns (pacing, act breaks, scene construction)
-   - Dialogue style (naturalistic vs stylized)
-   - Character development approach
-   - Visual storytelling techniques
-
-4. What They Look For in Scripts
-   - What excites them about a screenplay?
-   - Red flags and warning signs
-   - Pet peeves in scripts
-   - What makes a scene work for them
-
-5. Advice & Insights
-   - Advice they give to other filmmakers
-   - Common mistakes they see
-   - Lessons they've learned
-   - Their influences and inspirations
-
-6. Real Quotes & Examples
-   - Direct quotes about their process (verbatim)
-   - Examples from their own work
-   - Stories about specific creative decisions
-   - Behind-the-scenes insights
-
-PRIORITY SOURCES (find and analyze these):
-
-1. Director's Commentary Tracks
-   - Find YouTube videos or transcripts of director's commentary
-   - Example search: "{director_name} director's commentary"
-   - These are GOLD - hours of them explaining their choices scene-by-scene
-
-2. In-Depth Interviews
-   - Long-form interviews (30+ minutes)
-   - Podcasts about filmmaking (Marc Maron, Fresh Air, The Q&A, etc.)
-   - Written interviews in major publications
-   - Q&A sessions, masterclasses
-
-3. Expert Analysis
-   - Video essays analyzing their work
-   - Film criticism and scholarly analysis
-   - Books about their filmmaking
-   - Industry articles about their process
-
-4. Social Media & Public Statements
-   - Twitter/X threads about filmmaking
-   - Instagram posts with insights
-   - Reddit AMAs
-   - Public talks and presentations
-
-DELIVERABLES:
-
-For each source found:
-1. URL or citation
-2. Key quotes (verbatim, with timestamp/page number if possible)
-3. Insights extracted
-4. Categorize as: commentary/interview/analysis/social
-
-Focus on QUALITY sources where {director_name} speaks in their own words about their craft.
-
-Aim for:
-- 3+ hours of director's commentary transcripts (if available)
-- 10+ substantial interviews
-- 5+ expert analyses
-- Real quotes from multiple sources
-
-Generate a comprehensive research report organized by the focus areas above, with sources clearly cited.
-"""
-
-        return prompt
+        # str.join over the pre-split template: one allocation, no parsing
+        return director_name.join(_RESEARCH_PROMPT_PARTS)
 
     def import_research_report(
         self,
@@ -168,6 +170,135 @@ Generate a comprehensive research report organized by the focus areas above, wit
 
         return findings
 
+    def batch_import(
+        self,
+        reports: List[Tuple[str, str]],
+        poll_interval: float = 30.0,
+        interactive: bool = False
+    ) -> Dict[str, ResearchFindings]:
+        """
+        Import many Deep Research reports through the Message Batches API
+
+        Batch jobs are billed at half the interactive rate and don't count
+        against the per-minute request limit, but can take minutes to hours
+        to finish - use this for bulk refreshes, not interactive imports.
+
+        Args:
+            reports: (director_name, chatgpt_report) pairs
+            poll_interval: Seconds between batch status checks
+            interactive: Parse each report with a direct call instead of a
+                batch, for callers that can't wait on a batch's turnaround
+
+        Returns:
+            ResearchFindings per director, in input order
+
+        Raises:
+            ValueError: If a director appears more than once in reports
+        """
+        # Results are keyed by director, so a second report would silently
+        # replace the first
+        counts = Counter(director_name for director_name, _ in reports)
+        duplicates = sorted(name for name, count in counts.items() if count > 1)
+        if duplicates:
+            raise ValueError(f"Duplicate directors in batch: {', '.join(duplicates)}")
+
+        print(f"\n📥 Batch importing {len(reports)} Deep Research reports")
+        print("=" * 60)
+
+        if interactive:
+            return {
+                director_name: self._parse_report_with_ai(director_name, report)
+                for director_name, report in reports
+            }
+
+        parsed: Dict[str, Dict] = {}
+        pending: Dict[str, Tuple[str, str]] = {}
+
+        for i, (director_name, report) in enumerate(reports):
+            cache_key = self._parse_cache_key(director_name, report)
+            data = self.cache.get(cache_key) if cache_key else None
+            if data is not None:
+                parsed[director_name] = data
+            else:
+                # custom_id must match ^[a-zA-Z0-9_-]{1,64}$ and be unique
+                slug = re.sub(r'[^a-zA-Z0-9_-]', '_', director_name)
+                pending[f"{i}-{slug}"[:64]] = (director_name, report)
+
+        if pending:
+            batch = self.client.messages.batches.create(
+                requests=[
+                    {"custom_id": custom_id, "params": self._parse_request(*pending[custom_id])}
+                    for custom_id in pending
+                ]
+            )
+            print(f"  Submitted batch {batch.id} ({len(pending)} reports, {len(parsed)} cached)")
+
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            for entry in self.client.messages.batches.results(batch.id):
+                director_name, report = pending[entry.custom_id]
+                if entry.result.type != "succeeded":
+                    continue
+
+                text = ''.join(
+                    block.text for block in entry.result.message.content
+                    if block.type == "text"
+                )
+                json_text = extract_first_json_object(text)
+                if json_text is None:
+                    continue
+
+                try:
+                    data = fast_json.loads(json_text)
+                except ValueError:
+                    # Malformed reply; left for the interactive retry below
+                    continue
+                parsed[director_name] = data
+                cache_key = self._parse_cache_key(director_name, report)
+                if cache_key is not None:
+                    self.cache.set(cache_key, data)
+
+        findings = {}
+        for director_name, report in reports:
+            if director_name in parsed:
+                findings[director_name] = self._build_findings(director_name, parsed[director_name])
+            else:
+                # Errored, expired or unparseable in the batch; retry interactively
+                print(f"  ⚠️  Batch parse failed for {director_name}, retrying directly")
+                findings[director_name] = self._parse_report_with_ai(director_name, report)
+
+        print(f"\n✓ Batch import complete: {len(findings)} directors")
+
+        return findings
+
+    def _parse_request(self, director_name: str, report: str) -> Dict:
+        """Messages API parameters for parsing one report"""
+
+        prompt = f"""Parse this ChatGPT Deep Research report about {director_name} into structured data.
+
+Research Report:
+{report}"""
+
+        return {
+            "model": self.model,
+            "max_tokens": 8000,
+            "system": _PARSE_INSTRUCTIONS,
+            "messages": [{"role": "user", "content": prompt}]
+        }
+
+    def _parse_cache_key(self, director_name: str, report: str) -> Optional[str]:
+        """Parse cache key for a (director, report) pair (None if caching is off)"""
+        if self.cache is None:
+            return None
+        return make_cache_key(
+            model=self.model,
+            v=PARSE_PROMPT_VERSION,
+            director=director_name,
+            report=report
+        )
+
     def _parse_report_with_ai(
         self,
         director_name: str,
@@ -175,64 +306,34 @@ Generate a comprehensive research report organized by the focus areas above, wit
     ) -> ResearchFindings:
         """Use Claude to parse ChatGPT research report into structured data"""
 
-        prompt = f"""Parse this ChatGPT Deep Research report about {director_name} into structured data.
-
-Extract:
-1. All sources (with URLs if provided)
-2. Creative philosophy insights
-3. Process and mindset insights
-4. Themes and interests
-5. Technical preferences
-6. Pet peeves
-7. Advice given to filmmakers
-8. Real quotes (verbatim, with source attribution)
-9. Influences
+        # Identical (director, report) pairs skip the API entirely
+        cache_key = self._parse_cache_key(director_name, report)
+        if cache_key is not None:
+            data = self.cache.get(cache_key)
+            if data is not None:
+                print("  ↺ Using cached parse of this report")
+                return self._build_findings(director_name, data)
 
-Research Report:
-{report}
+        # Stream the reply and stop as soon as the JSON object closes,
+        # rather than waiting out any trailing commentary
+        scanner = JSONStreamScanner()
+        with self.client.messages.stream(**self._parse_request(director_name, report)) as stream:
+            for text in stream.text_stream:
+                scanner.feed(text)
+                if scanner.done:
+                    break
 
-Return as JSON:
-{{
-  "sources": [
-    {{
-      "url": "URL or citation",
-      "title": "Source title",
-      "type": "commentary/interview/analysis/social",
-      "key_points": ["point 1", "point 2"]
-    }}
-  ],
-  "creative_philosophy": ["insight 1", "insight 2", ...],
-  "process_insights": ["insight 1", "insight 2", ...],
-  "themes_and_interests": ["theme 1", "theme 2", ...],
-  "technical_preferences": ["preference 1", "preference 2", ...],
-  "pet_peeves": ["peeve 1", "peeve 2", ...],
-  "advice_given": ["advice 1", "advice 2", ...],
-  "real_quotes": [
-    "Quote 1 - Source",
-    "Quote 2 - Source"
-  ],
-  "influences": ["influence 1", "influence 2", ...]
-}}
+        if scanner.value is None:
+            raise ValueError("Could not parse AI response as JSON")
+        data = fast_json.loads(scanner.value)
 
-Be comprehensive - extract ALL insights and quotes."""
+        if cache_key is not None:
+            self.cache.set(cache_key, data)
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=8000,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        return self._build_findings(director_name, data)
 
-        # Parse JSON response
-        try:
-            data = json.loads(response.content[0].text)
-        except json.JSONDecodeError:
-            # Fallback: try to extract JSON from response
-            import re
-            json_match = re.search(r'\{.*\}', response.content[0].text, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
-            else:
-                raise ValueError("Could not parse AI response as JSON")
+    def _build_findings(self, director_name: str, data: Dict) -> ResearchFindings:
+        """Convert parsed report JSON into ResearchFindings"""
 
         # Convert to ResearchFindings
         findings = ResearchFindings(director_name=director_name)
@@ -242,7 +343,7 @@ Be comprehensive - extract ALL insights and quotes."""
             source = ResearchSource(
                 url=source_data.get('url', ''),
                 title=source_data.get('title', ''),
-                content='\n'.join(source_data.get('key_points', [])),
+                content='\n'.join(source_data.get('key_points', []))[:MAX_SOURCE_CONTENT_CHARS],
                 source_type=source_data.get('type', 'unknown')
             )
             findings.sources.append(source)
@@ -277,26 +378,26 @@ Be comprehensive - extract ALL insights and quotes."""
             Path to saved file
         """
 
-        import os
-        from pathlib import Path
-        from datetime import datetime
-
         # Create output directory
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Generate filename
         slug = director_name.lower().replace(' ', '_')
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"{slug}_chatgpt_research_{timestamp}.md"
         filepath = output_path / filename
 
-        # Save report
-        with open(filepath, 'w') as f:
-            f.write(f"# ChatGPT Deep Research: {director_name}\n\n")
-            f.write(f"**Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write("---\n\n")
-            f.write(report)
+        # Save report (one atomic write, so a crash can't leave a partial file)
+        write_text_file(
+            filepath,
+            f"# ChatGPT Deep Research: {director_name}\n\n"
+            f"**Date**: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            "---\n\n"
+            f"{report}",
+            atomic=True
+        )
 
         print(f"✓ Saved research report: {filepath}")
 
@@ -305,8 +406,6 @@ Be comprehensive - extract ALL insights and quotes."""
 
 # Example usage
 if __name__ == "__main__":
-    import sys
-
     importer = DeepResearchImporter()
 
     if len(sys.argv) < 2:
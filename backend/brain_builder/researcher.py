@@ -7,13 +7,129 @@ Gathers comprehensive information from:
 - Public statements (social media, talks)
 """
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Literal, Optional
 from dataclasses import dataclass, field
-from anthropic import Anthropic
+import asyncio
+import json
+import logging
 import os
+import re
+import sys
+from pathlib import Path
+
+# Add backend to path for services imports
+backend_path = Path(__file__).parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from services import fast_json
+from services.anthropic_client import get_anthropic_client
+from services.json_extract import JSONStreamScanner, extract_first_json_object
+from services.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+    from services.semantic_cache import SemanticCache
+    from services.source_clusters import SourceClusterCache
+
+logger = logging.getLogger(__name__)
+
+# Source text kept per source by ResearchFindings.to_dict()
+STORED_CONTENT_CHARS = 500
+
+# Sources marshaled into one insight-extraction call
+SOURCE_BATCH_SIZE = 8
+# A batch is closed early once its source text reaches this size, so one
+# long transcript doesn't drag seven others into an oversized prompt
+MAX_MARSHALED_CHARS = 12_000
+
+# Static extraction instructions, sent as the system prompt so only the
+# source text varies between calls. (At ~500 tokens they're under the
+# 1024-token prompt caching minimum, so no cache_control is set.)
+_INSIGHT_CATEGORIES = """Extract and categorize:
+1. Creative philosophy (what drives their choices)
+2. Process insights (how they work)
+3. Themes and interests (what they care about)
+4. Technical preferences (techniques, tools, style)
+5. Pet peeves (what frustrates them in scripts/filmmaking)
+6. Advice given (tips for other filmmakers)
+7. Real quotes (actual things they said, verbatim)
+8. Influences (who/what inspired them)"""
+
+_INSIGHT_INSTRUCTIONS = f"""You analyze a source about a director/writer and extract key insights.
+
+{_INSIGHT_CATEGORIES}
+
+Format as JSON:
+{{
+  "philosophy": ["insight 1", "insight 2"],
+  "process": ["insight 1", "insight 2"],
+  ...
+}}
+
+Be specific and quote directly when possible."""
+
+_BATCH_INSIGHT_INSTRUCTIONS = f"""You analyze several sources about a director/writer, given as a JSON array, and extract key insights from EACH source.
+
+{_INSIGHT_CATEGORIES}
+
+Format as a JSON array with one object per source, echoing its id:
+[
+  {{
+    "id": 0,
+    "philosophy": ["insight 1", "insight 2"],
+    "process": ["insight 1", "insight 2"],
+    "themes": [], "technical": [], "pet_peeves": [],
+    "advice": [], "quotes": [], "influences": []
+  }},
+  ...
+]
+
+Only attribute an insight to the source it came from. Be specific and quote directly when possible."""
+
+# Insight reply keys -> the ResearchFindings list fields they fill
+_INSIGHT_FIELDS = {
+    'philosophy': 'creative_philosophy',
+    'process': 'process_insights',
+    'themes': 'themes_and_interests',
+    'technical': 'technical_preferences',
+    'pet_peeves': 'pet_peeves',
+    'advice': 'advice_given',
+    'quotes': 'real_quotes',
+    'influences': 'influences',
+}
+
+# Numbered question line ("1. ...", "2) ...", "3 - ..."), number stripped
+_QUESTION_LINE = re.compile(r'^\s*\d+\s*[.):-]\s*(.*[A-Za-z].*?)\s*$')
+_WHITESPACE = re.compile(r'\s+')
+_PUNCTUATION = re.compile(r'[^\w\s]')
+
+
+def _dedup_key(text: str) -> str:
+    """Case/whitespace/punctuation-insensitive key for spotting repeated insights"""
+    return _WHITESPACE.sub(' ', _PUNCTUATION.sub('', text.lower())).strip()
+
+
+LatencyMode = Literal["standard", "optimized"]
 
+# Output cap for one source's insights. "optimized" trims it so a rambling
+# reply can't stretch tail latency; replies rarely need the full 2000, and
+# any that hit the cap are logged as truncated.
+SOURCE_MAX_TOKENS: Dict[str, int] = {"standard": 2000, "optimized": 1200}
 
-@dataclass
+# Estimated Jaccard similarity (same director and source type) at which a
+# previously analyzed source's insights are reused as-is, or offered as a
+# one-shot example
+CLUSTER_REUSE_SIMILARITY = 0.95
+CLUSTER_EXAMPLE_SIMILARITY = 0.8
+
+# Insight-extraction calls in flight at once
+MAX_CONCURRENT_REQUESTS = 4
+# Stay under the API's per-minute request cap
+REQUESTS_PER_MINUTE = 50
+
+
+@dataclass(slots=True)
 class ResearchSource:
     """Single source of information about the director"""
     url: str
@@ -24,7 +140,7 @@ class ResearchSource:
     confidence: float = 1.0  # How reliable is this source
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchFindings:
     """Aggregated research about a director"""
     director_name: str
@@ -40,6 +156,21 @@ class ResearchFindings:
     real_quotes: List[str] = field(default_factory=list)
     influences: List[str] = field(default_factory=list)
 
+    @property
+    def source_count(self) -> int:
+        """Number of sources analyzed"""
+        return len(self.sources)
+
+    @property
+    def insight_count(self) -> int:
+        """Total insights across the categories that drive confidence scoring"""
+        return sum(map(len, (
+            self.creative_philosophy,
+            self.process_insights,
+            self.themes_and_interests,
+            self.real_quotes
+        )))
+
     def to_dict(self) -> Dict:
         """Convert to dictionary for storage"""
         return {
@@ -48,7 +179,7 @@ class ResearchFindings:
                 {
                     'url': s.url,
                     'title': s.title,
-                    'content': s.content[:500],  # Truncate for storage
+                    'content': s.content[:STORED_CONTENT_CHARS],  # Truncate for storage
                     'source_type': s.source_type,
                     'date': s.date,
                     'confidence': s.confidence
@@ -77,11 +208,40 @@ class BrainResearcher:
     4. Synthesize findings
     """
 
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize researcher with Anthropic API"""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional["Anthropic"] = None,
+        semantic_cache: Optional["SemanticCache"] = None,
+        source_clusters: Optional["SourceClusterCache"] = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        requests_per_minute: int = REQUESTS_PER_MINUTE,
+        latency_mode: LatencyMode = "standard"
+    ):
+        """
+        Initialize researcher with Anthropic API
+
+        Args:
+            api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY)
+            client: Anthropic client (defaults to the shared per-key client)
+            semantic_cache: Optional cache; near-duplicate prompts for the
+                same director reuse earlier responses
+            source_clusters: Optional MinHash index of analyzed sources;
+                near-identical sources reuse earlier insights and similar
+                ones get them as a one-shot example
+            max_concurrency: Insight-extraction calls in flight at once
+            requests_per_minute: Rate limit for insight-extraction calls
+            latency_mode: "optimized" uses a tighter output cap for insight
+                extraction (replies cut off by it are logged)
+        """
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
-        self.client = Anthropic(api_key=self.api_key)
+        self.client = client or get_anthropic_client(self.api_key)
         self.model = "claude-3-5-haiku-20241022"  # Fast and cost-effective
+        self.semantic_cache = semantic_cache
+        self.source_clusters = source_clusters
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = RateLimiter(requests_per_minute, 60.0)
+        self.latency_mode = latency_mode
 
     def research_director(
         self,
@@ -146,6 +306,12 @@ Questions should cover:
 
 Return ONLY the questions, one per line, numbered."""
 
+        cache_namespace = f"questions:{director_name}"
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.get(cache_namespace, prompt)
+            if cached is not None:
+                return cached['questions']
+
         response = self.client.messages.create(
             model=self.model,
             max_tokens=1000,
@@ -155,11 +321,14 @@ Return ONLY the questions, one per line, numbered."""
         # Parse questions from response
         questions_text = response.content[0].text
         questions = [
-            q.strip().lstrip('0123456789.').strip()
-            for q in questions_text.split('\n')
-            if q.strip() and any(c.isalpha() for c in q)
+            match.group(1)
+            for line in questions_text.splitlines()
+            if (match := _QUESTION_LINE.match(line))
         ]
 
+        if self.semantic_cache is not None:
+            self.semantic_cache.set(cache_namespace, prompt, {'questions': questions})
+
         return questions
 
     def analyze_sources(
@@ -176,31 +345,194 @@ Return ONLY the questions, one per line, numbered."""
 
         Returns:
             Updated ResearchFindings
+
+        Note: Synchronous wrapper around analyze_sources_async(). From inside
+              a running event loop, await analyze_sources_async() directly.
+        """
+        return asyncio.run(self.analyze_sources_async(findings, sources))
+
+    async def analyze_sources_async(
+        self,
+        findings: ResearchFindings,
+        sources: List[ResearchSource]
+    ) -> ResearchFindings:
+        """
+        Analyze gathered sources and extract insights (async)
+
+        Source batches are sent concurrently, at most max_concurrency at a
+        time and within the per-minute rate limit. Insights are merged in
+        source order regardless of which call finishes first.
+
+        Args: Same as analyze_sources()
         """
         findings.sources.extend(sources)
 
-        # Analyze each source
-        for source in sources:
-            insights = self._extract_insights_from_source(
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def extract(batch: List[ResearchSource]) -> List[Dict[str, List[str]]]:
+            async with semaphore:
+                await self.rate_limiter.acquire()
+                # The shared sync client is thread-safe; run it off the loop
+                return await loop.run_in_executor(
+                    None,
+                    self._extract_insights_from_batch,
+                    findings.director_name,
+                    batch
+                )
+
+        # Near-identical sources analyzed before reuse their insights outright
+        reused: Dict[int, Dict[str, List[str]]] = {}
+        if self.source_clusters is not None:
+            for i, source in enumerate(sources):
+                match = self.source_clusters.find(
+                    findings.director_name,
+                    source.source_type,
+                    source.content
+                )
+                if match and match.similarity >= CLUSTER_REUSE_SIMILARITY:
+                    reused[i] = match.insights
+        pending = [source for i, source in enumerate(sources) if i not in reused]
+
+        results = await asyncio.gather(
+            *(extract(batch) for batch in self._batch_sources(pending))
+        )
+        extracted = [insights for batch_insights in results for insights in batch_insights]
+
+        if self.source_clusters is not None:
+            self.source_clusters.add_many(
                 findings.director_name,
-                source
+                [
+                    (source.source_type, source.content, insights)
+                    for source, insights in zip(pending, extracted)
+                    if any(insights.values())
+                ]
             )
 
-            # Add to appropriate categories
-            findings.creative_philosophy.extend(insights.get('philosophy', []))
-            findings.process_insights.extend(insights.get('process', []))
-            findings.themes_and_interests.extend(insights.get('themes', []))
-            findings.technical_preferences.extend(insights.get('technical', []))
-            findings.pet_peeves.extend(insights.get('pet_peeves', []))
-            findings.advice_given.extend(insights.get('advice', []))
-            findings.real_quotes.extend(insights.get('quotes', []))
-            findings.influences.extend(insights.get('influences', []))
-
-        # Deduplicate and synthesize
-        findings = self._deduplicate_findings(findings)
+        # Back into source order, then merge (deduplicating as it goes)
+        extracted_iter = iter(extracted)
+        self._merge_insights(
+            findings,
+            (reused[i] if i in reused else next(extracted_iter) for i in range(len(sources)))
+        )
 
         return findings
 
+    @staticmethod
+    def _batch_sources(sources: List[ResearchSource]) -> Iterator[List[ResearchSource]]:
+        """Group sources into batches of up to SOURCE_BATCH_SIZE / MAX_MARSHALED_CHARS"""
+        batch: List[ResearchSource] = []
+        batch_chars = 0
+
+        for source in sources:
+            if batch and (
+                len(batch) >= SOURCE_BATCH_SIZE
+                or batch_chars + len(source.content) > MAX_MARSHALED_CHARS
+            ):
+                yield batch
+                batch, batch_chars = [], 0
+            batch.append(source)
+            batch_chars += len(source.content)
+
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _merge_insights(
+        findings: ResearchFindings,
+        all_insights: Iterable[Dict[str, List[str]]]
+    ) -> None:
+        """
+        Add per-source insights to findings, deduplicating as they're added
+
+        Each category is staged in a dict keyed by the normalized insight,
+        seeded with what findings already holds, so the first occurrence
+        wins and order is preserved.
+        """
+        staged: Dict[str, Dict[str, str]] = {attr: {} for attr in _INSIGHT_FIELDS.values()}
+        for attr, unique in staged.items():
+            for item in getattr(findings, attr):
+                unique.setdefault(_dedup_key(item), item)
+
+        for insights in all_insights:
+            for key, attr in _INSIGHT_FIELDS.items():
+                unique = staged[attr]
+                for item in insights.get(key, []):
+                    unique.setdefault(_dedup_key(item), item)
+
+        for attr, unique in staged.items():
+            setattr(findings, attr, list(unique.values()))
+
+    def _extract_insights_from_batch(
+        self,
+        director_name: str,
+        sources: List[ResearchSource]
+    ) -> List[Dict[str, List[str]]]:
+        """
+        Extract structured insights from several sources in one call
+
+        Returns:
+            One insights dict per source, in the same order as sources
+        """
+        if len(sources) == 1:
+            return [self._extract_insights_from_source(director_name, sources[0])]
+
+        marshaled = json.dumps(
+            [
+                {
+                    "id": i,
+                    "type": source.source_type,
+                    "title": source.title,
+                    "content": source.content
+                }
+                for i, source in enumerate(sources)
+            ],
+            ensure_ascii=False,
+            indent=1
+        )
+
+        prompt = f"""Sources about {director_name} (JSON array):
+{marshaled}"""
+
+        cache_namespace = f"insight-batches:{director_name}"
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.get(cache_namespace, prompt)
+            if cached is not None:
+                return cached['results']
+
+        # Per-source results are parsed as each array element closes, so a
+        # reply cut off at max_tokens still keeps every completed source
+        by_id: Dict[int, Dict[str, List[str]]] = {}
+
+        def collect(item_text: str) -> None:
+            try:
+                item = fast_json.loads(item_text)
+            except json.JSONDecodeError:
+                return
+            if isinstance(item, dict) and isinstance(item.get('id'), int):
+                by_id[item['id']] = item
+
+        self._stream_json(
+            prompt,
+            max_tokens=min(SOURCE_MAX_TOKENS[self.latency_mode] * len(sources), 8000),
+            system=_BATCH_INSIGHT_INSTRUCTIONS,
+            brackets="[]",
+            on_item=collect
+        )
+
+        # Sources missing from the reply (skipped or truncated) get their own call
+        complete = all(i in by_id for i in range(len(sources)))
+        results = [
+            by_id[i] if i in by_id
+            else self._extract_insights_from_source(director_name, source)
+            for i, source in enumerate(sources)
+        ]
+
+        if complete and self.semantic_cache is not None:
+            self.semantic_cache.set(cache_namespace, prompt, {'results': results})
+
+        return results
+
     def _extract_insights_from_source(
         self,
         director_name: str,
@@ -208,40 +540,38 @@ Return ONLY the questions, one per line, numbered."""
     ) -> Dict[str, List[str]]:
         """Extract structured insights from a single source"""
 
-        prompt = f"""Analyze this {source.source_type} about {director_name} and extract key insights.
+        prompt = f"""Analyze this {source.source_type} about {director_name}.
 
 Source: {source.title}
-Content: {source.content}
-
-Extract and categorize:
-1. Creative philosophy (what drives their choices)
-2. Process insights (how they work)
-3. Themes and interests (what they care about)
-4. Technical preferences (techniques, tools, style)
-5. Pet peeves (what frustrates them in scripts/filmmaking)
-6. Advice given (tips for other filmmakers)
-7. Real quotes (actual things they said, verbatim)
-8. Influences (who/what inspired them)
-
-Format as JSON:
-{{
-  "philosophy": ["insight 1", "insight 2"],
-  "process": ["insight 1", "insight 2"],
-  ...
-}}
-
-Be specific and quote directly when possible."""
-
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=2000,
-            messages=[{"role": "user", "content": prompt}]
+Content: {source.content}"""
+
+        # A similar source already analyzed makes a good one-shot example
+        if self.source_clusters is not None:
+            match = self.source_clusters.find(director_name, source.source_type, source.content)
+            if match and match.similarity >= CLUSTER_EXAMPLE_SIMILARITY:
+                example = json.dumps(match.insights, ensure_ascii=False)
+                prompt += f"""
+
+A very similar {source.source_type} produced these insights. Match their structure and level of detail, keep any that also apply here, and add what's new:
+{example}"""
+
+        cache_namespace = f"insights:{director_name}"
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.get(cache_namespace, prompt)
+            if cached is not None:
+                return cached
+
+        response_text = self._stream_json(
+            prompt,
+            max_tokens=SOURCE_MAX_TOKENS[self.latency_mode],
+            system=_INSIGHT_INSTRUCTIONS
         )
 
         # Parse JSON response
-        import json
         try:
-            insights = json.loads(response.content[0].text)
+            insights = self._parse_json(response_text)
+            if self.semantic_cache is not None:
+                self.semantic_cache.set(cache_namespace, prompt, insights)
         except json.JSONDecodeError:
             # Fallback: simple parsing
             insights = {
@@ -257,21 +587,73 @@ Be specific and quote directly when possible."""
 
         return insights
 
+    def _stream_json(
+        self,
+        prompt: str,
+        max_tokens: int,
+        system: Optional[str] = None,
+        brackets: str = "{}",
+        on_item: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Stream a completion, scanning for its JSON value as text arrives
+
+        Stops reading as soon as the JSON value closes (skipping any
+        trailing commentary) and calls on_item with the JSON text of each
+        top-level element as it completes. A reply cut off at max_tokens
+        before its JSON value closes is logged as a warning.
+
+        Returns:
+            The JSON value if one completed, otherwise the full response text
+        """
+        scanner = JSONStreamScanner(brackets)
+        chunks = []
+
+        request = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}]
+        }
+        if system is not None:
+            request["system"] = system
+
+        with self.client.messages.stream(**request) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+                for item_text in scanner.feed(text):
+                    if on_item is not None:
+                        on_item(item_text)
+                if scanner.done:
+                    break
+
+            if not scanner.done and stream.get_final_message().stop_reason == "max_tokens":
+                logger.warning(
+                    "Reply truncated at max_tokens=%d before its JSON closed (latency_mode=%s)",
+                    max_tokens, self.latency_mode
+                )
+
+        return scanner.value or ''.join(chunks)
+
+    @staticmethod
+    def _parse_json(text: str, brackets: str = "{}"):
+        """Parse a JSON response, tolerating prose around the JSON value"""
+        try:
+            return fast_json.loads(text)
+        except json.JSONDecodeError:
+            json_text = extract_first_json_object(text, brackets)
+            if json_text is None:
+                raise
+            return fast_json.loads(json_text)
+
     def _deduplicate_findings(
         self,
         findings: ResearchFindings
     ) -> ResearchFindings:
         """Remove duplicate insights and consolidate similar ones"""
 
-        # Simple deduplication for now
-        findings.creative_philosophy = list(set(findings.creative_philosophy))
-        findings.process_insights = list(set(findings.process_insights))
-        findings.themes_and_interests = list(set(findings.themes_and_interests))
-        findings.technical_preferences = list(set(findings.technical_preferences))
-        findings.pet_peeves = list(set(findings.pet_peeves))
-        findings.advice_given = list(set(findings.advice_given))
-        findings.real_quotes = list(set(findings.real_quotes))
-        findings.influences = list(set(findings.influences))
+        # Keep the first occurrence of each insight, in order, so output is
+        # stable run to run (and downstream caches keyed on it still hit)
+        self._merge_insights(findings, ())
 
         return findings
 
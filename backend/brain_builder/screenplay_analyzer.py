@@ -11,18 +11,28 @@ Finds patterns in:
 """
 
 from typing import Dict, List, Optional
+from collections import Counter
 from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain
 from pathlib import Path
+import multiprocessing
+import os
 import sys
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+import numpy as np
+
+# Add backend to path if needed (worker processes re-import this module)
+backend_path = Path(__file__).parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
 
 from models.screenplay import Screenplay
-from services.parser import ScreenplayParser
+from services.parser import FountainParser
+from services.pdf_extractor import CachedPDFExtractor
 
 
-@dataclass
+@dataclass(slots=True)
 class StructuralPatterns:
     """Patterns in screenplay structure"""
     avg_scene_length: float = 0.0
@@ -32,7 +42,7 @@ class StructuralPatterns:
     tension_building: str = ""  # How they build tension
 
 
-@dataclass
+@dataclass(slots=True)
 class DialoguePatterns:
     """Patterns in dialogue style"""
     avg_dialogue_length: float = 0.0
@@ -42,7 +52,7 @@ class DialoguePatterns:
     naturalism_vs_stylization: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterPatterns:
     """Patterns in character development"""
     protagonist_traits: List[str] = field(default_factory=list)
@@ -51,7 +61,7 @@ class CharacterPatterns:
     relationship_dynamics: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ThematicPatterns:
     """Patterns in how themes are executed"""
     core_themes: List[str] = field(default_factory=list)
@@ -60,7 +70,7 @@ class ThematicPatterns:
     balance_theme_vs_entertainment: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreenplayAnalysis:
     """Complete analysis of a director's screenplays"""
     director_name: str
@@ -74,6 +84,22 @@ class ScreenplayAnalysis:
     genre_conventions_broken: List[str] = field(default_factory=list)
 
 
+# Scene heading prefixes for shots that are (at least partly) exterior
+_EXTERIOR_PREFIXES = ("EXT", "INT./EXT", "I/E")
+
+
+@dataclass(slots=True)
+class _SceneStats:
+    """Per-screenplay counts gathered in a single pass over the scenes"""
+    scene_lengths: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))  # Dialogue + action blocks per scene
+    total_dialogue: int = 0  # Dialogue blocks
+    total_action: int = 0  # Action blocks
+    dialogue_words: int = 0  # Words across all dialogue
+    dialogue_counts: Counter = field(default_factory=Counter)  # Character -> dialogue blocks
+    first_scene: Dict[str, int] = field(default_factory=dict)  # Character -> first scene index they speak in
+    first_heading: Optional[str] = None
+
+
 class ScreenplayPatternAnalyzer:
     """
     Analyzes patterns across multiple screenplays by a director
@@ -87,7 +113,10 @@ class ScreenplayPatternAnalyzer:
 
     def __init__(self):
         """Initialize analyzer"""
-        self.parser = ScreenplayParser()
+        self.parser = FountainParser()
+        # Reference screenplays are re-analyzed across brain builds, so
+        # their extracted text is cached on disk
+        self.pdf_extractor = CachedPDFExtractor()
 
     def analyze_screenplay(
         self,
@@ -105,92 +134,165 @@ class ScreenplayPatternAnalyzer:
             ScreenplayAnalysis with identified patterns
         """
         # Parse screenplay
-        screenplay = self.parser.parse_file(screenplay_path)
+        screenplay = self.parser.parse_file(screenplay_path, pdf_extractor=self.pdf_extractor)
 
         analysis = ScreenplayAnalysis(
             director_name=director_name,
             screenplays_analyzed=[screenplay.title or screenplay_path]
         )
 
+        # One pass over the scenes feeds every analysis
+        stats = self._collect_scene_stats(screenplay)
+
         # Analyze different aspects
-        analysis.structural = self._analyze_structure(screenplay)
-        analysis.dialogue = self._analyze_dialogue(screenplay)
-        analysis.character = self._analyze_characters(screenplay)
+        analysis.structural = self._analyze_structure(stats)
+        analysis.dialogue = self._analyze_dialogue(stats)
+        analysis.character = self._analyze_characters(stats)
         analysis.thematic = self._analyze_themes(screenplay)
-        analysis.notable_techniques = self._identify_techniques(screenplay)
+        analysis.notable_techniques = self._identify_techniques(stats)
 
         return analysis
 
     def analyze_multiple_screenplays(
         self,
         screenplay_paths: List[str],
-        director_name: str
+        director_name: str,
+        max_workers: Optional[int] = None
     ) -> ScreenplayAnalysis:
         """
         Analyze multiple screenplays to find consistent patterns
 
+        Each screenplay is parsed and analyzed in its own worker process
+        (PDF extraction is CPU-bound), then results are aggregated in order.
+
         Args:
             screenplay_paths: List of screenplay file paths
             director_name: Director's name
+            max_workers: Worker processes (None = CPU count, capped at the
+                number of screenplays; 1 = serial)
 
         Returns:
             Aggregated ScreenplayAnalysis
         """
         analyses = []
 
-        for path in screenplay_paths:
-            try:
-                analysis = self.analyze_screenplay(path, director_name)
-                analyses.append(analysis)
-            except Exception as e:
-                print(f"⚠️  Error analyzing {path}: {e}")
-                continue
+        if len(screenplay_paths) <= 1 or max_workers == 1:
+            for path in screenplay_paths:
+                try:
+                    analysis = self.analyze_screenplay(path, director_name)
+                    analyses.append(analysis)
+                except Exception as e:
+                    print(f"⚠️  Error analyzing {path}: {e}")
+                    continue
+        else:
+            # No point starting more workers than there are screenplays
+            workers = min(len(screenplay_paths), max_workers or os.cpu_count() or 1)
+            results: List[Optional[ScreenplayAnalysis]] = [None] * len(screenplay_paths)
+
+            # Spawn rather than fork: this can run on an executor thread
+            # (BrainBuilder.build_brain_async) while other threads hold
+            # logging/SSL/HTTP locks, and a forked child could inherit them
+            # locked. The initializer rebuilds all worker state anyway.
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_get_worker_analyzer
+            ) as executor:
+                futures = {
+                    executor.submit(_analyze_one, path, director_name): i
+                    for i, path in enumerate(screenplay_paths)
+                }
+                # Report progress as each finishes...
+                for done, future in enumerate(as_completed(futures), 1):
+                    i = futures[future]
+                    path = screenplay_paths[i]
+                    try:
+                        results[i] = future.result()
+                        print(f"  ✓ [{done}/{len(futures)}] {Path(path).name}")
+                    except Exception as e:
+                        print(f"⚠️  Error analyzing {path}: {e}")
+
+            # ...but aggregate in submission order so results are deterministic
+            analyses = [analysis for analysis in results if analysis is not None]
 
         # Aggregate patterns across all screenplays
         aggregated = self._aggregate_analyses(analyses, director_name)
 
         return aggregated
 
-    def _analyze_structure(self, screenplay: Screenplay) -> StructuralPatterns:
+    def _collect_scene_stats(self, screenplay: Screenplay) -> "_SceneStats":
+        """
+        Walk every scene element once, gathering everything the
+        structure/dialogue/character/technique analyses need
+
+        A dialogue block is a character cue plus the dialogue lines under
+        it; an action block is one action element.
+        """
+        # Preallocated so recording a scene's length is a store, not an append
+        stats = _SceneStats(scene_lengths=np.zeros(len(screenplay.scenes), dtype=np.int32))
+        if screenplay.scenes:
+            stats.first_heading = screenplay.scenes[0].heading
+
+        dialogue_counts = stats.dialogue_counts
+        first_scene = stats.first_scene
+
+        for index, scene in enumerate(screenplay.scenes):
+            speakers = []  # One entry per dialogue block
+            action_blocks = 0
+
+            for element in scene.elements:
+                kind = element.type
+                if kind == "dialogue":
+                    # Word count without allocating a split() list
+                    stats.dialogue_words += element.text.count(' ') + 1
+                elif kind == "character":
+                    # A handful of names repeated thousands of times; interned
+                    # keys hit the identity fast path in dict lookups
+                    name = sys.intern(element.text)
+                    speakers.append(name)
+                    first_scene.setdefault(name, index)
+                elif kind == "action":
+                    action_blocks += 1
+
+            # Counter.update on a list counts in C rather than per-item +=
+            dialogue_counts.update(speakers)
+            dialogue_blocks = len(speakers)
+
+            stats.scene_lengths[index] = dialogue_blocks + action_blocks
+            stats.total_dialogue += dialogue_blocks
+            stats.total_action += action_blocks
+
+        return stats
+
+    def _analyze_structure(self, stats: "_SceneStats") -> StructuralPatterns:
         """Analyze structural patterns"""
         patterns = StructuralPatterns()
 
-        if screenplay.scenes:
-            patterns.total_scenes = len(screenplay.scenes)
-
-            # Calculate average scene length
-            scene_lengths = []
-            for scene in screenplay.scenes:
-                # Count dialogue + action lines
-                length = len(scene.dialogue_blocks) + len(scene.action_blocks)
-                scene_lengths.append(length)
-
-            if scene_lengths:
-                patterns.avg_scene_length = sum(scene_lengths) / len(scene_lengths)
-
-                # Determine pacing
-                variance = max(scene_lengths) - min(scene_lengths)
-                if variance < 5:
-                    patterns.pacing_rhythm = "consistent"
-                elif variance < 15:
-                    patterns.pacing_rhythm = "varied"
-                else:
-                    patterns.pacing_rhythm = "highly_varied"
+        scene_lengths = stats.scene_lengths
+        if scene_lengths.size:
+            patterns.total_scenes = int(scene_lengths.size)
+
+            # Average scene length (dialogue + action blocks)
+            patterns.avg_scene_length = float(scene_lengths.mean())
+
+            # Determine pacing (range in one pass instead of max() + min())
+            variance = int(np.ptp(scene_lengths))
+            if variance < 5:
+                patterns.pacing_rhythm = "consistent"
+            elif variance < 15:
+                patterns.pacing_rhythm = "varied"
+            else:
+                patterns.pacing_rhythm = "highly_varied"
 
         return patterns
 
-    def _analyze_dialogue(self, screenplay: Screenplay) -> DialoguePatterns:
+    def _analyze_dialogue(self, stats: "_SceneStats") -> DialoguePatterns:
         """Analyze dialogue patterns"""
         patterns = DialoguePatterns()
 
-        all_dialogue = []
-        for scene in screenplay.scenes:
-            for dialogue in scene.dialogue_blocks:
-                all_dialogue.append(dialogue.text)
-
-        if all_dialogue:
+        if stats.total_dialogue:
             # Average dialogue length
-            avg_length = sum(len(d.split()) for d in all_dialogue) / len(all_dialogue)
+            avg_length = stats.dialogue_words / stats.total_dialogue
             patterns.avg_dialogue_length = avg_length
 
             # Classify style based on length
@@ -203,32 +305,22 @@ class ScreenplayPatternAnalyzer:
 
         return patterns
 
-    def _analyze_characters(self, screenplay: Screenplay) -> CharacterPatterns:
+    def _analyze_characters(self, stats: "_SceneStats") -> CharacterPatterns:
         """Analyze character patterns"""
         patterns = CharacterPatterns()
 
         # Get protagonist (most dialogue)
-        if screenplay.scenes:
-            character_dialogue_count = {}
-            for scene in screenplay.scenes:
-                for dialogue in scene.dialogue_blocks:
-                    char = dialogue.character
-                    character_dialogue_count[char] = character_dialogue_count.get(char, 0) + 1
-
-            if character_dialogue_count:
-                protagonist = max(character_dialogue_count, key=character_dialogue_count.get)
-
-                # Analyze protagonist introduction (first scene they appear)
-                for i, scene in enumerate(screenplay.scenes):
-                    char_names = [d.character for d in scene.dialogue_blocks]
-                    if protagonist in char_names:
-                        if i == 0:
-                            patterns.introduction_style = "immediate (scene 1)"
-                        elif i < 3:
-                            patterns.introduction_style = "early (first few scenes)"
-                        else:
-                            patterns.introduction_style = f"delayed (scene {i+1})"
-                        break
+        if stats.dialogue_counts:
+            protagonist = stats.dialogue_counts.most_common(1)[0][0]
+
+            # Analyze protagonist introduction (first scene they speak in)
+            i = stats.first_scene[protagonist]
+            if i == 0:
+                patterns.introduction_style = "immediate (scene 1)"
+            elif i < 3:
+                patterns.introduction_style = "early (first few scenes)"
+            else:
+                patterns.introduction_style = f"delayed (scene {i+1})"
 
         return patterns
 
@@ -244,22 +336,19 @@ class ScreenplayPatternAnalyzer:
 
         return patterns
 
-    def _identify_techniques(self, screenplay: Screenplay) -> List[str]:
+    def _identify_techniques(self, stats: "_SceneStats") -> List[str]:
         """Identify notable storytelling techniques"""
         techniques = []
 
-        if screenplay.scenes:
+        if stats.scene_lengths.size:
             # Check for cold open
-            if len(screenplay.scenes) > 0:
-                first_scene = screenplay.scenes[0]
-                if first_scene.heading and "EXT" in first_scene.heading:
-                    techniques.append("Often opens with exterior establishing shot")
+            # Slug lines lead with the location type, so only the prefix matters
+            # ("INT. NEXT DOOR" is an interior)
+            if stats.first_heading and stats.first_heading.startswith(_EXTERIOR_PREFIXES):
+                techniques.append("Often opens with exterior establishing shot")
 
             # Check for dialogue-heavy vs action-heavy
-            total_dialogue = sum(len(s.dialogue_blocks) for s in screenplay.scenes)
-            total_action = sum(len(s.action_blocks) for s in screenplay.scenes)
-
-            ratio = total_dialogue / (total_action + 1)  # Avoid division by zero
+            ratio = stats.total_dialogue / (stats.total_action + 1)  # Avoid division by zero
             if ratio > 2:
                 techniques.append("Dialogue-driven storytelling")
             elif ratio < 0.5:
@@ -291,18 +380,16 @@ class ScreenplayPatternAnalyzer:
         # Aggregate structural patterns
         avg_scene_lengths = [a.structural.avg_scene_length for a in analyses if a.structural.avg_scene_length > 0]
         if avg_scene_lengths:
-            aggregated.structural.avg_scene_length = sum(avg_scene_lengths) / len(avg_scene_lengths)
+            aggregated.structural.avg_scene_length = float(np.mean(avg_scene_lengths))
 
         # Aggregate techniques (find common ones)
-        all_techniques = [tech for a in analyses for tech in a.notable_techniques]
-        technique_counts = {}
-        for tech in all_techniques:
-            technique_counts[tech] = technique_counts.get(tech, 0) + 1
+        technique_counts = Counter(chain.from_iterable(a.notable_techniques for a in analyses))
 
         # Keep techniques that appear in multiple screenplays
+        threshold = len(analyses) / 2  # Appears in at least half
         common_techniques = [
             tech for tech, count in technique_counts.items()
-            if count >= len(analyses) / 2  # Appears in at least half
+            if count >= threshold
         ]
         aggregated.notable_techniques = common_techniques
 
@@ -313,11 +400,13 @@ class ScreenplayPatternAnalyzer:
         analysis: ScreenplayAnalysis
     ) -> str:
         """Generate human-readable pattern analysis report"""
+        screenplays_block = "\n".join("- " + title for title in analysis.screenplays_analyzed)
+        techniques_block = "\n".join("- " + tech for tech in analysis.notable_techniques)
 
         report = f"""# Screenplay Pattern Analysis: {analysis.director_name}
 
 ## Screenplays Analyzed
-{chr(10).join(f'- {title}' for title in analysis.screenplays_analyzed)}
+{screenplays_block}
 
 ## Structural Patterns
 - Total scenes: {analysis.structural.total_scenes}
@@ -332,9 +421,27 @@ class ScreenplayPatternAnalyzer:
 - Protagonist introduction: {analysis.character.introduction_style}
 
 ## Notable Techniques
-{chr(10).join(f'- {tech}' for tech in analysis.notable_techniques)}
+{techniques_block}
 
 ---
 Generated by Brain Builder
 """
         return report
+
+
+# Each worker process builds one analyzer (and parser) and reuses it for
+# every screenplay it's handed
+_worker_analyzer: Optional[ScreenplayPatternAnalyzer] = None
+
+
+def _get_worker_analyzer() -> ScreenplayPatternAnalyzer:
+    """This process's shared analyzer (also the pool initializer, to pre-warm it)"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = ScreenplayPatternAnalyzer()
+    return _worker_analyzer
+
+
+def _analyze_one(screenplay_path: str, director_name: str) -> ScreenplayAnalysis:
+    """Analyze a single screenplay in a worker process (must be top-level to pickle)"""
+    return _get_worker_analyzer().analyze_screenplay(screenplay_path, director_name)
@@ -9,37 +9,62 @@ User can:
 - Ask "how would you fix this scene?"
 """
 
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from dataclasses import dataclass, field
-from anthropic import Anthropic
+import asyncio
 import os
 
+from services.anthropic_client import get_anthropic_client
+from services.file_io import write_text_file
 
-@dataclass
+# Budget for the coverage report excerpt in the system prompt
+COVERAGE_CONTEXT_TOKENS = 500
+
+# Rough fallback when the token count can't be fetched
+CHARS_PER_TOKEN = 4
+
+
+@dataclass(slots=True)
 class Message:
     """Single message in conversation"""
     role: str  # "user" or "assistant"
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatSession:
     """Chat session with a Horror Brain"""
     brain_name: str
     brain_persona: str  # Full persona document
     coverage_context: Optional[str] = None  # Coverage report for context
     messages: List[Message] = field(default_factory=list)
+    system_prompt: Optional[str] = None  # Built once from the fields above
+    # messages in Anthropic API format, kept in step by add_message()
+    api_messages: List[Dict[str, str]] = field(default_factory=list)
+    # "Speaker: content" transcript entries, also kept in step by add_message()
+    history_parts: List[str] = field(default_factory=list)
+
+    def set_coverage_context(self, coverage_context: Optional[str]) -> None:
+        """Replace the coverage context (the system prompt is rebuilt on the next turn)"""
+        self.coverage_context = coverage_context
+        self.system_prompt = None
 
     def add_message(self, role: str, content: str) -> None:
         """Add message to conversation history"""
         self.messages.append(Message(role=role, content=content))
+        self.api_messages.append({"role": role, "content": content})
+        speaker = "You" if role == "user" else self.brain_name
+        self.history_parts.append(f"{speaker}: {content}")
+
+    def pop_message(self) -> Message:
+        """Remove and return the most recent message"""
+        self.api_messages.pop()
+        self.history_parts.pop()
+        return self.messages.pop()
 
     def get_conversation_history(self) -> List[Dict[str, str]]:
         """Get conversation in Anthropic API format"""
-        return [
-            {"role": msg.role, "content": msg.content}
-            for msg in self.messages
-        ]
+        return self.api_messages
 
 
 class BrainChat:
@@ -53,7 +78,8 @@ class BrainChat:
     def __init__(self, api_key: Optional[str] = None):
         """Initialize chat system"""
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
-        self.client = Anthropic(api_key=self.api_key)
+        # Shared per API key, so every chat/debate reuses one connection pool
+        self.client = get_anthropic_client(self.api_key)
         self.model = "claude-3-5-sonnet-20241022"
 
     def start_chat(
@@ -79,9 +105,9 @@ class BrainChat:
             coverage_context=coverage_context
         )
 
-        # Add system message to establish context
-        system_intro = self._build_system_prompt(session)
-        session.add_message("assistant", system_intro)
+        # Build the system prompt once; every turn reuses it. It's sent as
+        # the API's system parameter, not stored as a conversation message.
+        session.system_prompt = self._build_system_prompt(session)
 
         return session
 
@@ -100,34 +126,85 @@ class BrainChat:
         Returns:
             Brain's response
         """
+        return "".join(self.send_message_stream(session, user_message))
+
+    async def asend_message(
+        self,
+        session: ChatSession,
+        user_message: str
+    ) -> str:
+        """
+        Async send_message, for fanning one prompt out to several brains
+
+        The request runs on a worker thread with the shared client, so
+        concurrent calls overlap their network round-trips:
+
+            replies = await asyncio.gather(*(
+                chat.asend_message(session, message) for session in sessions
+            ))
+
+        Each session must only have one message in flight at a time.
+
+        Args:
+            session: Active chat session
+            user_message: User's message
+
+        Returns:
+            Brain's response
+        """
+        return await asyncio.to_thread(self.send_message, session, user_message)
+
+    def send_message_stream(
+        self,
+        session: ChatSession,
+        user_message: str
+    ) -> Iterator[str]:
+        """
+        Send message to brain and yield the response as it's generated
+
+        The first text arrives after time-to-first-token instead of after
+        the whole reply. The full reply is added to the session history
+        once the stream completes; if it fails or is abandoned part way,
+        the user message is rolled back so history stays consistent.
+
+        Args:
+            session: Active chat session
+            user_message: User's message
+
+        Yields:
+            Chunks of the brain's response text
+        """
 
         # Add user message to history
         session.add_message("user", user_message)
 
-        # Build system prompt
-        system_prompt = self._build_system_prompt(session)
-
-        # Get conversation history (excluding system intro)
-        conversation = [
-            {"role": msg.role, "content": msg.content}
-            for msg in session.messages[1:]  # Skip system intro
-        ]
-
-        # Call API
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=2000,
-            system=system_prompt,
-            messages=conversation
-        )
-
-        # Extract response
-        brain_response = response.content[0].text
+        # System prompt is cached on the session (rebuilt only if context changed)
+        if session.system_prompt is None:
+            session.system_prompt = self._build_system_prompt(session)
+
+        chunks = []
+        try:
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=2000,
+                # Persona + coverage is identical every turn, so cache it as a
+                # prompt prefix instead of having it reprocessed each time
+                system=[{
+                    "type": "text",
+                    "text": session.system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }],
+                messages=session.api_messages
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    yield text
+        except BaseException:
+            session.pop_message()
+            raise
 
         # Add to history
-        session.add_message("assistant", brain_response)
-
-        return brain_response
+        session.add_message("assistant", "".join(chunks))
 
     def _build_system_prompt(self, session: ChatSession) -> str:
         """Build system prompt for brain conversation"""
@@ -184,13 +261,51 @@ They may ask you to:
 
 For reference, here's the coverage report you provided:
 
-{session.coverage_context[:2000]}  # Truncate if too long
+{self._truncate_to_tokens(session.coverage_context, COVERAGE_CONTEXT_TOKENS)}
 
 The writer may ask about specific notes from this report.
 """
 
         return prompt
 
+    def _truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        """
+        Cut text to roughly max_tokens tokens, at a line or word boundary
+
+        Runs once per session (the system prompt is cached), so the token
+        count costs one request at most, and none for text too short to
+        be over budget (a token is never shorter than one character).
+
+        Args:
+            text: Text to truncate
+            max_tokens: Token budget
+
+        Returns:
+            text, or a prefix of it that fits the budget
+        """
+        if len(text) <= max_tokens:
+            return text
+
+        try:
+            count = self.client.messages.count_tokens(
+                model=self.model,
+                messages=[{"role": "user", "content": text}]
+            )
+            tokens = count.input_tokens
+        except Exception:
+            # Offline or unsupported - fall back to a characters-per-token guess
+            tokens = len(text) / CHARS_PER_TOKEN
+
+        if tokens <= max_tokens:
+            return text
+
+        # Keep the same share of characters as of tokens
+        cut = int(len(text) * max_tokens / tokens)
+        boundary = max(text.rfind("\n", 0, cut), text.rfind(" ", 0, cut))
+        if boundary > cut // 2:
+            cut = boundary
+        return text[:cut].rstrip() + "\n[...]"
+
     def continue_conversation(
         self,
         session: ChatSession,
@@ -201,11 +316,7 @@ The writer may ask about specific notes from this report.
 
     def get_chat_history(self, session: ChatSession) -> str:
         """Get formatted chat history"""
-        history = []
-        for msg in session.messages[1:]:  # Skip system intro
-            speaker = "You" if msg.role == "user" else session.brain_name
-            history.append(f"{speaker}: {msg.content}")
-        return "\n\n".join(history)
+        return "\n\n".join(session.history_parts)
 
     def save_chat(self, session: ChatSession, output_path: str) -> None:
         """Save chat session to file"""
@@ -218,8 +329,7 @@ The writer may ask about specific notes from this report.
 ---
 Generated by Chat with the Pros
 """
-        with open(output_path, 'w') as f:
-            f.write(content)
+        write_text_file(output_path, content)
 
         print(f"✓ Saved chat to {output_path}")
 
@@ -253,7 +363,8 @@ without being obviously threatening.
 
     # Simulate conversation
     user_msg = "Jordan, you said the opening lacks dread. Can you elaborate on what you mean?"
-    response = chat.send_message(session, user_msg)
-
     print(f"User: {user_msg}")
-    print(f"\nJordan Peele: {response}")
+    print("\nJordan Peele: ", end="", flush=True)
+    for chunk in chat.send_message_stream(session, user_msg):
+        print(chunk, end="", flush=True)
+    print()
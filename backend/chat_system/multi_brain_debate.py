@@ -9,11 +9,29 @@ Allows multiple Horror Brains to:
 5. Disagree honestly (no compromise just to get along)
 """
 
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, TextIO
 from dataclasses import dataclass, field
-from anthropic import Anthropic
+from functools import cached_property
+import asyncio
+import functools
+import io
 import os
 
+from services.anthropic_client import get_anthropic_client
+from services.llm_cache import CacheBackend, MemoryCache, make_cache_key
+
+# Messages sent verbatim in each brain's context; older ones are folded
+# into a rolling summary
+HISTORY_WINDOW_TURNS = 6
+SUMMARY_MAX_TOKENS = 400
+
+# Write buffer for saved transcripts
+SAVE_BUFFER_BYTES = 1 << 20
+
+# Consensus reports kept by the default in-process cache (least recently
+# used evicted first), so a long-lived server doesn't grow without bound
+CONSENSUS_CACHE_SIZE = 128
+
 
 @dataclass
 class DebateParticipant:
@@ -38,16 +56,37 @@ class DebateSession:
     context: Optional[str] = None  # Scene/screenplay context
     messages: List[DebateMessage] = field(default_factory=list)
     user_visible: bool = True  # Is user watching?
+    history_summary: Optional[str] = None  # Summary of messages[:summarized_count]
+    summarized_count: int = 0
+    # messages split by visibility, kept in step by add_message()
+    _public_messages: List[DebateMessage] = field(init=False, repr=False)
+    _private_messages: List[DebateMessage] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._public_messages = [msg for msg in self.messages if not msg.is_private]
+        self._private_messages = [msg for msg in self.messages if msg.is_private]
 
     def add_message(self, speaker: str, content: str, is_private: bool = False) -> None:
         """Add message to debate"""
-        self.messages.append(
-            DebateMessage(speaker=speaker, content=content, is_private=is_private)
-        )
+        message = DebateMessage(speaker=speaker, content=content, is_private=is_private)
+        self.messages.append(message)
+        if is_private:
+            self._private_messages.append(message)
+        else:
+            self._public_messages.append(message)
+
+    @cached_property
+    def participant_names(self) -> str:
+        """Comma-separated participant names, for prompts and transcripts"""
+        return ', '.join(p.name for p in self.participants)
 
     def get_public_messages(self) -> List[DebateMessage]:
         """Get only public messages (user can see)"""
-        return [msg for msg in self.messages if not msg.is_private]
+        return self._public_messages
+
+    def get_private_messages(self) -> List[DebateMessage]:
+        """Get only private debate messages (brains only)"""
+        return self._private_messages
 
     def get_all_messages(self) -> List[DebateMessage]:
         """Get all messages including private debate"""
@@ -62,10 +101,27 @@ class MultiBrainDebate:
     with goal of reaching best creative outcome.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize debate system"""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        window_turns: int = HISTORY_WINDOW_TURNS,
+        cache: Optional[CacheBackend] = None
+    ):
+        """
+        Initialize debate system
+
+        Args:
+            api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY)
+            window_turns: Most recent messages sent verbatim each turn
+            cache: Consensus report cache (defaults to an in-process LRU of
+                CONSENSUS_CACHE_SIZE reports); re-reporting an unchanged
+                private debate skips the API
+        """
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
-        self.client = Anthropic(api_key=self.api_key)
+        self.window_turns = window_turns
+        self.cache = cache if cache is not None else MemoryCache(maxsize=CONSENSUS_CACHE_SIZE)
+        # Same client (and connection pool) as BrainChat for this key
+        self.client = get_anthropic_client(self.api_key)
         self.model = "claude-3-5-sonnet-20241022"
 
     def start_debate(
@@ -99,7 +155,8 @@ class MultiBrainDebate:
     def facilitate_debate(
         self,
         session: DebateSession,
-        rounds: int = 3
+        rounds: int = 3,
+        on_text: Optional[Callable[[str, str], None]] = None
     ) -> DebateSession:
         """
         Facilitate a debate for specified rounds
@@ -107,15 +164,63 @@ class MultiBrainDebate:
         Args:
             session: Active debate session
             rounds: Number of back-and-forth rounds
+            on_text: Optional callback(speaker, text) for each chunk of a
+                response as it streams in
+
+        Returns:
+            Updated session with debate messages
+        """
+        return asyncio.run(self.facilitate_debate_async(session, rounds=rounds, on_text=on_text))
+
+    async def facilitate_debate_async(
+        self,
+        session: DebateSession,
+        rounds: int = 3,
+        on_text: Optional[Callable[[str, str], None]] = None
+    ) -> DebateSession:
+        """
+        Async facilitate_debate
+
+        Within a round every participant responds to the conversation as it
+        stood at the start of the round, so their requests are independent
+        and run concurrently (a round takes about one response's latency,
+        not one per participant). Replies are added in participant order.
+
+        Args:
+            session: Active debate session
+            rounds: Number of back-and-forth rounds
+            on_text: Optional callback(speaker, text) for each chunk of a
+                response as it streams in. It's called from worker threads,
+                with participants' chunks interleaved.
 
         Returns:
             Updated session with debate messages
         """
 
+        # System prompts don't change between rounds, so build them once
+        system_prompts = [
+            self._build_debate_system_prompt(session, participant)
+            for participant in session.participants
+        ]
+
         for round_num in range(rounds):
+            # Fold older messages into the summary if the window is full
+            await asyncio.to_thread(self._update_history_summary, session)
+
+            # Everyone sees the same conversation this round
+            conversation_context = self._build_conversation_context(session)
+
             # Each participant speaks
-            for participant in session.participants:
-                response = self._get_brain_response(session, participant)
+            responses = await asyncio.gather(*(
+                asyncio.to_thread(
+                    self._get_brain_response,
+                    system_prompt,
+                    conversation_context,
+                    functools.partial(on_text, participant.name) if on_text else None
+                )
+                for participant, system_prompt in zip(session.participants, system_prompts)
+            ))
+            for participant, response in zip(session.participants, responses):
                 session.add_message(
                     speaker=participant.name,
                     content=response,
@@ -161,50 +266,71 @@ class MultiBrainDebate:
 
     def _get_brain_response(
         self,
-        session: DebateSession,
-        participant: DebateParticipant
+        system_prompt: List[Dict],
+        conversation_context: str,
+        on_text: Optional[Callable[[str], None]] = None
     ) -> str:
-        """Get response from a specific brain in debate"""
-
-        # Build conversation history
-        conversation_context = self._build_conversation_context(session)
+        """
+        Get response from a specific brain in debate
 
-        # Build system prompt
-        system_prompt = self._build_debate_system_prompt(session, participant)
+        Args:
+            system_prompt: The brain's debate system prompt blocks
+            conversation_context: Debate so far (from _build_conversation_context)
+            on_text: Optional callback for each chunk as it streams in
+        """
 
-        # Call API
-        response = self.client.messages.create(
+        # Call API (streamed, so chunks can be relayed as they arrive)
+        chunks = []
+        with self.client.messages.stream(
             model=self.model,
             max_tokens=1500,
             system=system_prompt,
             messages=[{"role": "user", "content": conversation_context}]
-        )
+        ) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+                if on_text is not None:
+                    on_text(text)
 
-        return response.content[0].text
+        return "".join(chunks)
 
     def _build_debate_system_prompt(
         self,
         session: DebateSession,
         participant: DebateParticipant
+    ) -> List[Dict]:
+        """
+        Build system prompt for debate participant
+
+        The persona and debate rules come first, marked for prompt caching:
+        they're resent every round (and in every debate the brain joins
+        with the same people), so later requests read them from the cache.
+        The topic and visibility follow in an uncached block.
+        """
+        return [
+            {
+                "type": "text",
+                "text": self._build_persona_block(session, participant),
+                "cache_control": {"type": "ephemeral"}
+            },
+            {"type": "text", "text": self._build_topic_block(session)}
+        ]
+
+    def _build_persona_block(
+        self,
+        session: DebateSession,
+        participant: DebateParticipant
     ) -> str:
-        """Build system prompt for debate participant"""
+        """Persona and debate rules (the same for every round and topic)"""
 
         other_participants = [p.name for p in session.participants if p.name != participant.name]
 
-        prompt = f"""You are {participant.name}, participating in a creative debate with {', '.join(other_participants)}.
+        return f"""You are {participant.name}, participating in a creative debate with {', '.join(other_participants)}.
 
 # Your Persona
 
 {participant.persona}
 
-# Debate Topic
-
-{session.topic}
-
-# Debate Context
-
-{"User is watching this conversation." if session.user_visible else "This is a PRIVATE debate between you and the other directors. The user will see a summary later."}
-
 # How to Engage
 
 **Be yourself**:
@@ -240,34 +366,96 @@ class MultiBrainDebate:
 **Remember**: The user hired you all for your honest expertise. Give it to them.
 """
 
-        return prompt
+    def _build_topic_block(self, session: DebateSession) -> str:
+        """Debate topic and whether the user is watching"""
+
+        return f"""# Debate Topic
+
+{session.topic}
+
+# Debate Context
+
+{"User is watching this conversation." if session.user_visible else "This is a PRIVATE debate between you and the other directors. The user will see a summary later."}
+"""
 
     def _build_conversation_context(self, session: DebateSession) -> str:
         """Build conversation context for next response"""
 
-        context = f"""# Debate Topic
+        # Collected and joined once; += in the message loop would recopy
+        # the growing transcript for every message
+        parts = [f"""# Debate Topic
 {session.topic}
 
-"""
+"""]
 
         if session.context:
-            context += f"""# Screenplay Context
+            parts.append(f"""# Screenplay Context
 {session.context}
 
-"""
+""")
+
+        if session.history_summary:
+            parts.append(f"""# Earlier Discussion (summary)
+{session.history_summary}
+
+""")
 
         if session.messages:
-            context += """# Conversation So Far
+            parts.append("""# Conversation So Far
+
+""")
+            parts.extend(
+                f"{msg.speaker}: {msg.content}\n\n"
+                for msg in session.messages[session.summarized_count:]
+            )
+            parts.append("""Your turn. What's your take?""")
+        else:
+            parts.append("""You're speaking first. What's your take on this?""")
+
+        return "".join(parts)
+
+    def _update_history_summary(self, session: DebateSession) -> None:
+        """
+        Fold older messages into the session's rolling summary
+
+        Only runs once more than window_turns messages are unsummarized;
+        it then summarizes all but the newest half-window, so the window
+        refills for a while before the next summary call.
+        """
+        unsummarized = len(session.messages) - session.summarized_count
+        if unsummarized <= self.window_turns:
+            return
+
+        keep = self.window_turns // 2
+        cutoff = len(session.messages) - keep
+        older = "\n\n".join(
+            f"{msg.speaker}: {msg.content}"
+            for msg in session.messages[session.summarized_count:cutoff]
+        )
+
+        previous = ""
+        if session.history_summary:
+            previous = f"""# Summary So Far
+{session.history_summary}
 
 """
-            for msg in session.messages:
-                context += f"{msg.speaker}: {msg.content}\n\n"
 
-            context += """Your turn. What's your take?"""
-        else:
-            context += """You're speaking first. What's your take on this?"""
+        prompt = f"""Summarize this part of a debate between {session.participant_names} about "{session.topic}".
+
+{previous}# Messages to Add
+{older}
 
-        return context
+Write one updated summary covering everything above. Keep each person's positions, \
+where they agreed and disagreed, and any proposals still on the table. Be concise."""
+
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=SUMMARY_MAX_TOKENS,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        session.history_summary = response.content[0].text
+        session.summarized_count = cutoff
 
     def _generate_consensus_report(self, session: DebateSession) -> str:
         """Generate consensus report from private debate"""
@@ -275,11 +463,10 @@ class MultiBrainDebate:
         # Get all private messages
         debate_history = "\n\n".join([
             f"{msg.speaker}: {msg.content}"
-            for msg in session.messages
-            if msg.is_private
+            for msg in session.get_private_messages()
         ])
 
-        prompt = f"""Review this private debate between {', '.join([p.name for p in session.participants])} and generate a consensus report for the user.
+        prompt = f"""Review this private debate between {session.participant_names} and generate a consensus report for the user.
 
 # Debate Topic
 {session.topic}
@@ -320,18 +507,27 @@ Format:
 [What the writer should do]
 
 ---
-{', '.join([p.name for p in session.participants])}
+{session.participant_names}
 ```
 
 Generate the report now."""
 
+        # The prompt holds the topic, participants and whole private
+        # history, so it identifies the debate state exactly
+        cache_key = make_cache_key(model=self.model, prompt=prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached['text']
+
         response = self.client.messages.create(
             model=self.model,
             max_tokens=2000,
             messages=[{"role": "user", "content": prompt}]
         )
 
-        return response.content[0].text
+        report = response.content[0].text
+        self.cache.set(cache_key, {"text": report})
+        return report
 
     def get_debate_transcript(
         self,
@@ -339,22 +535,38 @@ Generate the report now."""
         include_private: bool = False
     ) -> str:
         """Get formatted debate transcript"""
+        buf = io.StringIO()
+        self.write_debate_transcript(session, buf, include_private=include_private)
+        return buf.getvalue()
+
+    def write_debate_transcript(
+        self,
+        session: DebateSession,
+        out: TextIO,
+        include_private: bool = False
+    ) -> None:
+        """
+        Write formatted debate transcript to a text stream, message by message
+
+        Args:
+            session: Debate session
+            out: Destination (open file, StringIO, ...)
+            include_private: Include private debate messages
+        """
 
         messages = session.get_all_messages() if include_private else session.get_public_messages()
 
-        transcript = f"""# Debate: {session.topic}
+        out.write(f"""# Debate: {session.topic}
 
 ## Participants
-{', '.join([p.name for p in session.participants])}
+{session.participant_names}
 
 ## Conversation
 
-"""
+""")
         for msg in messages:
             private_marker = " [PRIVATE]" if msg.is_private else ""
-            transcript += f"**{msg.speaker}**{private_marker}:\n{msg.content}\n\n---\n\n"
-
-        return transcript
+            out.write(f"**{msg.speaker}**{private_marker}:\n{msg.content}\n\n---\n\n")
 
     def save_debate(
         self,
@@ -364,10 +576,10 @@ Generate the report now."""
     ) -> None:
         """Save debate transcript to file"""
 
-        transcript = self.get_debate_transcript(session, include_private=include_private)
-
-        with open(output_path, 'w') as f:
-            f.write(transcript)
+        # Streamed straight to the file, so a long transcript is never held
+        # in memory as one string
+        with open(output_path, 'w', encoding='utf-8', buffering=SAVE_BUFFER_BYTES) as f:
+            self.write_debate_transcript(session, f, include_private=include_private)
 
         print(f"✓ Saved debate transcript to {output_path}")
 
@@ -31,11 +31,12 @@ Usage:
 
 import os
 import logging
-import json
+import time
 import traceback
-from datetime import datetime
 from typing import Any, Optional, Dict
 
+from services import fast_json
+
 # Determine if we're in development mode
 IS_DEV = os.getenv('ENV', 'development') == 'development'
 
@@ -53,12 +54,32 @@ def _format_json(data: Any) -> str:
     """Pretty-print JSON data"""
     try:
         if isinstance(data, (dict, list)):
-            return json.dumps(data, indent=2, default=str)
+            return fast_json.dumps_indented(data, default=str)
         return str(data)
     except Exception:
         return str(data)
 
 
+class _LazyJson:
+    """
+    Defers _format_json until a handler actually emits the record
+
+    Pass as a %s argument (logger.debug("Data:\n%s", _LazyJson(data))) so
+    suppressed records never serialize their payload.
+    """
+    __slots__ = ('data', 'limit')
+
+    def __init__(self, data: Any, limit: Optional[int] = None):
+        self.data = data
+        self.limit = limit  # Truncate the formatted text to this many chars
+
+    def __str__(self) -> str:
+        text = _format_json(self.data)
+        if self.limit is not None and len(text) > self.limit:
+            text = text[:self.limit] + "... (truncated)"
+        return text
+
+
 def log_request(method: str, path: str, body: Optional[Dict] = None, headers: Optional[Dict] = None):
     """
     Log incoming HTTP requests
@@ -75,16 +96,16 @@ def log_request(method: str, path: str, body: Optional[Dict] = None, headers: Op
     logger.info(f"🔵 REQUEST {method} {path}")
 
     if body:
-        logger.debug(f"   Body:\n{_format_json(body)}")
+        logger.debug("   Body:\n%s", _LazyJson(body))
 
-    if headers:
+    if headers and logger.isEnabledFor(logging.DEBUG):
         # Don't log sensitive headers
         safe_headers = {
             k: v for k, v in headers.items()
             if k.lower() not in ['authorization', 'cookie', 'x-api-key']
         }
         if safe_headers:
-            logger.debug(f"   Headers:\n{_format_json(safe_headers)}")
+            logger.debug("   Headers:\n%s", _LazyJson(safe_headers))
 
 
 def log_response(method: str, path: str, status: int, data: Optional[Any] = None):
@@ -105,10 +126,7 @@ def log_response(method: str, path: str, status: int, data: Optional[Any] = None
 
     if data is not None:
         # Truncate large responses
-        data_str = _format_json(data)
-        if len(data_str) > 1000:
-            data_str = data_str[:1000] + "... (truncated)"
-        logger.debug(f"   Data:\n{data_str}")
+        logger.debug("   Data:\n%s", _LazyJson(data, limit=1000))
 
 
 def log_error(context: str, error: Exception, metadata: Optional[Dict] = None):
@@ -125,7 +143,7 @@ def log_error(context: str, error: Exception, metadata: Optional[Dict] = None):
     logger.error(f"   Message: {str(error)}")
 
     if metadata:
-        logger.error(f"   Metadata:\n{_format_json(metadata)}")
+        logger.error("   Metadata:\n%s", _LazyJson(metadata))
 
     if IS_DEV:
         # Full stack trace in dev
@@ -151,7 +169,7 @@ def log_debug(context: str, data: Optional[Any] = None):
         return
 
     if data is not None:
-        logger.debug(f"🔍 {context}:\n{_format_json(data)}")
+        logger.debug("🔍 %s:\n%s", context, _LazyJson(data))
     else:
         logger.debug(f"🔍 {context}")
 
@@ -171,10 +189,10 @@ def log_state(action: str, before: Optional[Any] = None, after: Optional[Any] =
     logger.debug(f"📊 STATE: {action}")
 
     if before is not None:
-        logger.debug(f"   Before:\n{_format_json(before)}")
+        logger.debug("   Before:\n%s", _LazyJson(before))
 
     if after is not None:
-        logger.debug(f"   After:\n{_format_json(after)}")
+        logger.debug("   After:\n%s", _LazyJson(after))
 
 
 def log_database(operation: str, table: str, data: Optional[Any] = None):
@@ -192,7 +210,7 @@ def log_database(operation: str, table: str, data: Optional[Any] = None):
     logger.debug(f"💾 DATABASE {operation} {table}")
 
     if data is not None:
-        logger.debug(f"   Data:\n{_format_json(data)}")
+        logger.debug("   Data:\n%s", _LazyJson(data))
 
 
 def log_perf(label: str, duration_ms: float, threshold: float = 1000):
@@ -222,7 +240,7 @@ def log_warn(context: str, data: Optional[Any] = None):
     logger.warning(f"⚠️ WARNING: {context}")
 
     if data is not None and IS_DEV:
-        logger.warning(f"   Details:\n{_format_json(data)}")
+        logger.warning("   Details:\n%s", _LazyJson(data))
 
 
 def log_info(message: str, data: Optional[Any] = None):
@@ -236,7 +254,7 @@ def log_info(message: str, data: Optional[Any] = None):
     logger.info(f"ℹ️ {message}")
 
     if data is not None and IS_DEV:
-        logger.info(f"   Data:\n{_format_json(data)}")
+        logger.info("   Data:\n%s", _LazyJson(data))
 
 
 class PerformanceTimer:
@@ -250,15 +268,16 @@ class PerformanceTimer:
 
     def __init__(self, label: str):
         self.label = label
-        self.start_time = None
+        self.start_ns = None
 
     def __enter__(self):
-        self.start_time = datetime.now()
+        # Monotonic integer clock: cheap to read, unaffected by clock changes
+        self.start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.start_time:
-            duration_ms = (datetime.now() - self.start_time).total_seconds() * 1000
+        if self.start_ns is not None:
+            duration_ms = (time.perf_counter_ns() - self.start_ns) / 1e6
             log_perf(self.label, duration_ms)
 
 
@@ -3,23 +3,39 @@ FastAPI server for Screenplay AI Reviewer
 """
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
+import asyncio
 import tempfile
+from collections import defaultdict
 import os
 from pathlib import Path
 from dotenv import load_dotenv
+import numpy as np
 
 # Load environment variables from .env file
 load_dotenv()
 
+from services import fast_json
 from services.parser import FountainParser
 from services.feedback_engine import FeedbackEngine, ReviewSession
 from services.ai_provider import AnthropicProvider
 from models.reviewer import REVIEWER_PROFILES
 from models.entity import EntityTracker
 
-app = FastAPI(title="Screenplay AI Reviewer API")
+# Render JSON with orjson when it's installed (optional, see services/fast_json.py)
+app = FastAPI(
+    title="Screenplay AI Reviewer API",
+    default_response_class=ORJSONResponse if fast_json.orjson is not None else JSONResponse
+)
+
+# Read size when copying uploads to disk
+UPLOAD_CHUNK_BYTES = 1 << 20
+
+# overall_stats keys, in the column order of the stats rows
+OVERALL_STAT_KEYS = ("avg_engagement", "avg_enjoyment", "avg_suspense", "avg_confusion")
 
 # CORS middleware for frontend
 app.add_middleware(
@@ -30,6 +46,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Review responses carry long feedback text that compresses several-fold
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 class AnalyzeRequest(BaseModel):
     """Request to analyze a screenplay"""
@@ -56,6 +75,17 @@ class AnalysisResponse(BaseModel):
     overall_stats: dict
 
 
+_ai_provider: Optional[AnthropicProvider] = None
+
+
+def get_ai_provider() -> AnthropicProvider:
+    """Process-wide AI provider (created on first request, then reused)"""
+    global _ai_provider
+    if _ai_provider is None:
+        _ai_provider = AnthropicProvider()
+    return _ai_provider
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -109,20 +139,23 @@ async def analyze_screenplay(
             detail=f"Invalid reviewer IDs: {', '.join(invalid_reviewers)}"
         )
 
-    # Save uploaded file temporarily
+    # Save uploaded file temporarily, a chunk at a time so memory use stays
+    # flat however large the upload is
     with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp_file:
-        content = await file.read()
-        tmp_file.write(content)
         tmp_file_path = tmp_file.name
+        while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+            tmp_file.write(chunk)
 
     try:
         # Parse screenplay
+        # Parsing (PDF extraction) and the review (blocking API calls) run in
+        # worker threads so the event loop keeps serving other requests
         parser = FountainParser()
-        screenplay = parser.parse_file(tmp_file_path)
+        screenplay = await asyncio.to_thread(parser.parse_file, tmp_file_path)
 
         # Initialize AI provider
         try:
-            ai_provider = AnthropicProvider()
+            ai_provider = get_ai_provider()
         except ValueError as e:
             raise HTTPException(
                 status_code=500,
@@ -130,11 +163,12 @@ async def analyze_screenplay(
             )
 
         # Initialize entity tracker
-        entity_tracker = EntityTracker()
+        appearances = defaultdict(list)  # Character -> scene numbers, in order
         for scene in screenplay.scenes:
             for entity_name in scene.characters_present:
-                entity = entity_tracker.get_or_create_character(entity_name, scene.scene_number)
-                entity.add_appearance(scene.scene_number)
+                appearances[entity_name].append(scene.scene_number)
+        entity_tracker = EntityTracker()
+        entity_tracker.bulk_load_characters(appearances)
 
         # Initialize feedback engine with AI provider
         engine = FeedbackEngine(
@@ -146,33 +180,43 @@ async def analyze_screenplay(
         )
 
         # Process screenplay (this will take a while with AI calls)
-        session = engine.review_screenplay(screenplay, entity_tracker)
+        session = await asyncio.to_thread(engine.review_screenplay, screenplay, entity_tracker)
 
         # Format response
         feedback_list = []
+        stat_rows = []  # (engagement, enjoyment, suspense, confusion) per feedback
         for scene_feedback in session.all_feedback:
+            state = scene_feedback.emotional_state
+            engagement = state.engagement_level
+            enjoyment = state.enjoyment
+            confusion = state.confusion
+            suspense = state.suspense
+
+            # Plain dicts: FastAPI validates the whole response against
+            # AnalysisResponse once, so building models here would only
+            # add a second validation and a dump
             feedback_list.append({
                 "scene_number": scene_feedback.scene_number,
                 "reviewer_id": scene_feedback.reviewer_id,
                 "reviewer_name": scene_feedback.reviewer_name,
                 "feedback": scene_feedback.feedback,
                 "emotional_state": {
-                    "engagement": scene_feedback.emotional_state.engagement_level,
-                    "enjoyment": scene_feedback.emotional_state.enjoyment,
-                    "confusion": scene_feedback.emotional_state.confusion,
-                    "suspense": scene_feedback.emotional_state.suspense,
-                    "excitement": scene_feedback.emotional_state.excitement,
+                    "engagement": engagement,
+                    "enjoyment": enjoyment,
+                    "confusion": confusion,
+                    "suspense": suspense,
+                    "excitement": state.excitement,
                 },
                 "scene_rating": scene_feedback.scene_rating,
             })
-
-        # Calculate overall stats
-        overall_stats = {
-            "avg_engagement": sum(f["emotional_state"]["engagement"] for f in feedback_list) / len(feedback_list) if feedback_list else 0,
-            "avg_enjoyment": sum(f["emotional_state"]["enjoyment"] for f in feedback_list) / len(feedback_list) if feedback_list else 0,
-            "avg_suspense": sum(f["emotional_state"]["suspense"] for f in feedback_list) / len(feedback_list) if feedback_list else 0,
-            "avg_confusion": sum(f["emotional_state"]["confusion"] for f in feedback_list) / len(feedback_list) if feedback_list else 0,
-        }
+            # Gathered in the same pass, not re-read from the response dicts
+            stat_rows.append((engagement, enjoyment, suspense, confusion))
+
+        # Calculate overall stats (averaged per column)
+        overall_stats = dict.fromkeys(OVERALL_STAT_KEYS, 0)
+        if stat_rows:
+            states = np.array(stat_rows, dtype=np.float64)
+            overall_stats.update(zip(OVERALL_STAT_KEYS, states.mean(axis=0).tolist()))
 
         return {
             "screenplay_title": screenplay.title,
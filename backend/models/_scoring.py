@@ -0,0 +1,113 @@
+"""
+Importance scoring kernels
+
+Plain numeric functions behind Entity.update_importance,
+EntityTracker.update_all_importance_scores and Question.update_importance,
+so the single-item and all-at-once paths share one formula. They are
+JIT-compiled with Numba when it's installed and run as ordinary
+Python/NumPy otherwise. Numba is an optional extra, not listed in
+requirements.txt (it pins its own NumPy/Python ranges); install it
+separately (pip install numba) to enable the JIT.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on environment
+    njit = None
+
+
+def _jit(fn):
+    """Compile fn with Numba if available"""
+    return njit(cache=True)(fn) if njit is not None else fn
+
+
+@_jit
+def entity_score(speaking_lines, total_appearances, first_appearance, last_appearance,
+                 current_scene, mentions, relationships, critical_moments, high_moments):
+    """
+    Importance score of one entity
+
+    Based on:
+    - Speaking lines (0.25)
+    - Appearances (0.20)
+    - Scene span (0.15)
+    - Mentioned when absent (0.15)
+    - Relationships (0.10)
+    - Key moments (0.15)
+    - Recency bonus (0.10)
+
+    Returns:
+        Score clamped to 1.0
+    """
+    speaking_weight = min(speaking_lines / 10.0, 1.0) * 0.25
+    appearance_weight = min(total_appearances / 5.0, 1.0) * 0.20
+    if current_scene > 0:
+        span_weight = (last_appearance - first_appearance) / current_scene * 0.15
+    else:
+        span_weight = 0.0
+    mention_weight = min(mentions / 5.0, 1.0) * 0.15
+    relationship_weight = min(relationships / 3.0, 1.0) * 0.10
+    key_moments_weight = min((critical_moments * 1.0 + high_moments * 0.5) / 3.0, 1.0) * 0.15
+    recency_bonus = 0.10 if (current_scene - last_appearance) < 3 else 0.0
+
+    total = (speaking_weight + appearance_weight + span_weight +
+             mention_weight + relationship_weight + key_moments_weight + recency_bonus)
+    return min(total, 1.0)
+
+
+@_jit
+def entity_scores(speaking_lines, total_appearances, first_appearance, last_appearance,
+                  current_scene, mentions, relationships, critical_moments, high_moments):
+    """
+    entity_score over float64 arrays, one element per entity
+
+    Returns:
+        Array of scores clamped to 1.0
+    """
+    speaking_weight = np.minimum(speaking_lines / 10.0, 1.0) * 0.25
+    appearance_weight = np.minimum(total_appearances / 5.0, 1.0) * 0.20
+    if current_scene > 0:
+        span_weight = (last_appearance - first_appearance) / current_scene * 0.15
+    else:
+        span_weight = np.zeros(speaking_lines.shape[0])
+    mention_weight = np.minimum(mentions / 5.0, 1.0) * 0.15
+    relationship_weight = np.minimum(relationships / 3.0, 1.0) * 0.10
+    key_moments_weight = np.minimum((critical_moments * 1.0 + high_moments * 0.5) / 3.0, 1.0) * 0.15
+    recency_bonus = np.where((current_scene - last_appearance) < 3, 0.10, 0.0)
+
+    total = (speaking_weight + appearance_weight + span_weight +
+             mention_weight + relationship_weight + key_moments_weight + recency_bonus)
+    return np.minimum(total, 1.0)
+
+
+@_jit
+def question_score(reference_count, raised_in_scene, current_scene, narrative_weight,
+                   entity_importance, urgency, last_reference):
+    """
+    Importance score of one question
+
+    Based on:
+    - Reference count (0.25)
+    - Duration (0.15)
+    - Narrative weight (0.30)
+    - Entity importance (0.15)
+    - Urgency (0.15)
+    - Recency boost (0.10, needs at least one reference)
+
+    Returns:
+        Score clamped to 1.0
+    """
+    reference_count_score = min(reference_count / 5.0, 1.0) * 0.25
+    if current_scene > raised_in_scene:
+        duration_score = (current_scene - raised_in_scene) / current_scene * 0.15
+    else:
+        duration_score = 0.0
+    narrative_score = narrative_weight * 0.30
+    entity_score = entity_importance * 0.15
+    urgency_score = urgency * 0.15
+    recency_boost = 0.10 if reference_count > 0 and (current_scene - last_reference) < 3 else 0.0
+
+    total = (reference_count_score + duration_score + narrative_score +
+             entity_score + urgency_score + recency_boost)
+    return min(total, 1.0)
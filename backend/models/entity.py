@@ -1,9 +1,14 @@
 """
 Entity tracking models - prevents "forgotten maid" problem
 """
-from typing import List, Dict, Optional, Set
-from pydantic import BaseModel, Field
+from typing import Annotated, Iterable, List, Dict, Optional, Set
+from dataclasses import dataclass, field
+from pydantic import BaseModel, Field, PrivateAttr
 from enum import Enum
+import re
+import numpy as np
+
+from models._scoring import entity_score, entity_scores
 
 
 class EntityType(str, Enum):
@@ -14,7 +19,22 @@ class EntityType(str, Enum):
     RELATIONSHIP = "relationship"
 
 
-class KeyMoment(BaseModel):
+# Entity ID prefix per type, e.g. "CHARACTER" for CHARACTER_001
+_ENTITY_PREFIX = {t: t.value.upper() for t in EntityType}
+
+
+# Marks state derived from other fields: kept out of Pydantic dumps of the
+# trackers that hold these dataclasses
+_DERIVED = Field(exclude=True)
+
+
+def _derived(default_factory):
+    """Dataclass field for state rebuilt in __post_init__ (not init/repr/compare)"""
+    return field(default_factory=default_factory, init=False, repr=False, compare=False)
+
+
+@dataclass(slots=True, kw_only=True)
+class KeyMoment:
     """A significant moment involving this entity"""
     scene_id: str
     scene_number: int
@@ -22,7 +42,8 @@ class KeyMoment(BaseModel):
     significance: str  # low, medium, high, critical
 
 
-class Relationship(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Relationship:
     """Relationship between two entities"""
     entity_id: str
     entity_name: str
@@ -31,21 +52,24 @@ class Relationship(BaseModel):
     since_scene: Optional[int] = None
 
 
-class Entity(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Entity:
     """
     Tracked entity (character, object, location)
 
-    Prevents plot-critical elements from being forgotten
+    Prevents plot-critical elements from being forgotten. A plain slotted
+    dataclass rather than a Pydantic model: entities are mutated many
+    times per scene, and attribute access is the hot path.
     """
     entity_id: str  # e.g., "MAID_001", "WILL_001"
     entity_type: EntityType
     name: str
-    aliases: List[str] = Field(default_factory=list)
+    aliases: List[str] = field(default_factory=list)
 
     # Tracking
     first_appearance: int  # Scene number
     last_appearance: int
-    appearances: List[int] = Field(default_factory=list)  # All scene numbers
+    appearances: List[int] = field(default_factory=list)  # All scene numbers
     total_appearances: int = 0
 
     # For characters
@@ -56,14 +80,52 @@ class Entity(BaseModel):
     importance_score: float = 0.0  # 0.0 to 1.0
 
     # Narrative significance
-    key_moments: List[KeyMoment] = Field(default_factory=list)
-    relationships: List[Relationship] = Field(default_factory=list)
-    mentioned_when_absent: List[int] = Field(default_factory=list)  # Scenes discussed but not present
+    key_moments: List[KeyMoment] = field(default_factory=list)
+    relationships: List[Relationship] = field(default_factory=list)
+    mentioned_when_absent: List[int] = field(default_factory=list)  # Scenes discussed but not present
     narrative_function: Optional[str] = None  # protagonist, antagonist, mentor, etc.
 
     # Metadata
     description: Optional[str] = None
-    tags: List[str] = Field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+
+    # Upper-cased name/aliases, computed once instead of on every comparison
+    _name_upper: Annotated[str, _DERIVED] = _derived(str)
+    _aliases_upper: Annotated[Set[str], _DERIVED] = _derived(set)
+
+    # Set view of appearances for O(1) membership tests
+    _appearances_set: Annotated[Set[int], _DERIVED] = _derived(set)
+
+    # Running key moment counts by significance, kept by add_key_moment
+    _critical_moments: Annotated[int, _DERIVED] = _derived(int)
+    _high_moments: Annotated[int, _DERIVED] = _derived(int)
+
+    def __post_init__(self) -> None:
+        """Cache the upper-cased name and aliases, and the appearance set"""
+        self._name_upper = self.name.upper()
+        self._aliases_upper = {alias.upper() for alias in self.aliases}
+        self._appearances_set = set(self.appearances)
+        self._critical_moments = sum(1 for m in self.key_moments if m.significance == "critical")
+        self._high_moments = sum(1 for m in self.key_moments if m.significance == "high")
+
+    def appears_in(self, scene_number: int) -> bool:
+        """Check whether the entity appears in a scene"""
+        return scene_number in self._appearances_set
+
+    def matches_name(self, name: str) -> bool:
+        """Check whether name is this entity's name or an alias (case-insensitive)"""
+        name_upper = name.upper()
+        return name_upper == self._name_upper or name_upper in self._aliases_upper
+
+    def _add_alias(self, alias: str) -> None:
+        """
+        Add an alias, keeping the upper-cased alias set in sync
+
+        Called by EntityTracker.add_alias, which also updates its name index
+        """
+        if alias not in self.aliases:
+            self.aliases.append(alias)
+        self._aliases_upper.add(alias.upper())
 
     def update_importance(self, current_scene: int) -> float:
         """
@@ -77,42 +139,18 @@ class Entity(BaseModel):
         - Relationships (0.10)
         - Key moments (0.15)
         """
-        # Speaking weight (adjusted for shorter screenplays)
-        speaking_weight = min(self.speaking_lines / 10.0, 1.0) * 0.25
-
-        # Appearance weight (adjusted for shorter screenplays)
-        appearance_weight = min(self.total_appearances / 5.0, 1.0) * 0.20
-
-        # Span weight (appears early and late = important)
-        if current_scene > 0:
-            span = (self.last_appearance - self.first_appearance) / current_scene
-            span_weight = span * 0.15
-        else:
-            span_weight = 0.0
-
-        # Mentioned when absent (people talk about them)
-        mention_weight = min(len(self.mentioned_when_absent) / 5.0, 1.0) * 0.15
-
-        # Relationship complexity
-        relationship_weight = min(len(self.relationships) / 3.0, 1.0) * 0.10
-
-        # Key moments
-        critical_moments = sum(1 for m in self.key_moments if m.significance == "critical")
-        high_moments = sum(1 for m in self.key_moments if m.significance == "high")
-        key_moments_weight = min((critical_moments * 1.0 + high_moments * 0.5) / 3.0, 1.0) * 0.15
-
-        # Recency bonus (appeared recently)
-        recency_bonus = 0.10 if (current_scene - self.last_appearance) < 3 else 0.0
-
-        total = (speaking_weight + appearance_weight + span_weight +
-                mention_weight + relationship_weight + key_moments_weight + recency_bonus)
-
-        self.importance_score = min(total, 1.0)
+        self.importance_score = entity_score(
+            self.speaking_lines, self.total_appearances,
+            self.first_appearance, self.last_appearance, current_scene,
+            len(self.mentioned_when_absent), len(self.relationships),
+            self._critical_moments, self._high_moments
+        )
         return self.importance_score
 
     def add_appearance(self, scene_number: int, spoke: bool = False, lines: int = 0):
         """Record an appearance in a scene"""
-        if scene_number not in self.appearances:
+        if scene_number not in self._appearances_set:
+            self._appearances_set.add(scene_number)
             self.appearances.append(scene_number)
             self.total_appearances = len(self.appearances)
 
@@ -130,6 +168,10 @@ class Entity(BaseModel):
             moment=moment,
             significance=significance
         ))
+        if significance == "critical":
+            self._critical_moments += 1
+        elif significance == "high":
+            self._high_moments += 1
 
     def add_relationship(self, entity_id: str, entity_name: str,
                         relationship_type: str, tension: Optional[str] = None,
@@ -178,6 +220,30 @@ class EntityTracker(BaseModel):
         EntityType.RELATIONSHIP: 0
     })
 
+    # Upper-cased name/alias -> entity_id, so lookups are one dict probe
+    _name_index: Dict[str, str] = PrivateAttr(default_factory=dict)
+
+    # Scene number -> ids of entities appearing in it, in recording order
+    _scene_index: Dict[int, List[str]] = PrivateAttr(default_factory=dict)
+
+    # Pattern matching every indexed name/alias, built on demand and
+    # dropped whenever the name index changes
+    _matcher: Optional[re.Pattern] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context) -> None:
+        """Rebuild the lookup indexes for trackers constructed with entities"""
+        for entity in self.entities.values():
+            self._index_entity(entity)
+
+    def _index_entity(self, entity: Entity) -> None:
+        # First entity to claim a name keeps it, like the old in-order scan
+        self._name_index.setdefault(entity._name_upper, entity.entity_id)
+        for alias_upper in entity._aliases_upper:
+            self._name_index.setdefault(alias_upper, entity.entity_id)
+        self._matcher = None
+        for scene_number in entity.appearances:
+            self._scene_index.setdefault(scene_number, []).append(entity.entity_id)
+
     def add_entity(self, name: str, entity_type: EntityType,
                    first_scene: int, aliases: Optional[List[str]] = None) -> Entity:
         """Add a new entity"""
@@ -187,8 +253,9 @@ class EntityTracker(BaseModel):
             return existing
 
         # Generate ID
-        self.entity_counter[entity_type] += 1
-        entity_id = f"{entity_type.value.upper()}_{self.entity_counter[entity_type]:03d}"
+        n = self.entity_counter[entity_type] + 1
+        self.entity_counter[entity_type] = n
+        entity_id = f"{_ENTITY_PREFIX[entity_type]}_{n:03d}"
 
         entity = Entity(
             entity_id=entity_id,
@@ -202,21 +269,82 @@ class EntityTracker(BaseModel):
         )
 
         self.entities[entity_id] = entity
+        self._index_entity(entity)
         return entity
 
+    def add_alias(self, entity_id: str, alias: str) -> None:
+        """Add an alias to an entity, keeping the name index in sync"""
+        self.entities[entity_id]._add_alias(alias)
+        self._name_index.setdefault(alias.upper(), entity_id)
+        self._matcher = None
+
+    def record_appearance(self, entity_id: str, scene_number: int,
+                          spoke: bool = False, lines: int = 0) -> None:
+        """Record an entity's appearance in a scene, keeping the scene index in sync"""
+        entity = self.entities[entity_id]
+        if not entity.appears_in(scene_number):
+            self._scene_index.setdefault(scene_number, []).append(entity_id)
+        entity.add_appearance(scene_number, spoke=spoke, lines=lines)
+
     def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Get entity by ID"""
         return self.entities.get(entity_id)
 
+    def get_importance_by_ids(self, entity_ids: Iterable[str]) -> np.ndarray:
+        """
+        Importance scores of the given entities, skipping unknown ids
+
+        Args:
+            entity_ids: Entity IDs to look up
+
+        Returns:
+            float64 array of scores, in the order of entity_ids
+        """
+        entities = self.entities
+        return np.fromiter(
+            (entity.importance_score for entity_id in entity_ids
+             if (entity := entities.get(entity_id)) is not None),
+            dtype=np.float64
+        )
+
     def find_entity_by_name(self, name: str) -> Optional[Entity]:
         """Find entity by name or alias"""
-        name_upper = name.upper()
-        for entity in self.entities.values():
-            if entity.name.upper() == name_upper:
-                return entity
-            if name_upper in [alias.upper() for alias in entity.aliases]:
-                return entity
-        return None
+        entity_id = self._name_index.get(name.upper())
+        return self.entities.get(entity_id) if entity_id else None
+
+    def build_matcher(self) -> Optional[re.Pattern]:
+        """
+        Compile one pattern that matches any entity name or alias
+
+        Names are tried longest first, so "THE MAID" wins over "MAID",
+        and must stand alone as words. The regex engine scans a text
+        once for all names instead of searching for each one separately.
+
+        Returns:
+            Pattern over upper-cased text, or None if nothing is tracked
+        """
+        if self._matcher is None and self._name_index:
+            names = sorted(self._name_index, key=len, reverse=True)
+            self._matcher = re.compile(
+                r"(?<!\w)(?:" + "|".join(map(re.escape, names)) + r")(?!\w)"
+            )
+        return self._matcher
+
+    def find_all_in_text(self, text: str) -> Set[str]:
+        """
+        Find the entities mentioned in a passage
+
+        Args:
+            text: Any screenplay text (action, dialogue, ...)
+
+        Returns:
+            IDs of entities whose name or an alias appears in text
+        """
+        matcher = self.build_matcher()
+        if matcher is None:
+            return set()
+        name_index = self._name_index
+        return {name_index[m.group()] for m in matcher.finditer(text.upper())}
 
     def get_or_create_character(self, name: str, scene_number: int) -> Entity:
         """Get existing character or create new one"""
@@ -225,10 +353,69 @@ class EntityTracker(BaseModel):
             return entity
         return self.add_entity(name, EntityType.CHARACTER, scene_number)
 
+    def bulk_load_characters(self, appearances: Dict[str, List[int]]) -> None:
+        """
+        Record many characters' appearances at once
+
+        Equivalent to calling get_or_create_character + add_appearance for
+        every (name, scene) pair in order, but each new character is built
+        once with its full appearance list instead of one call per scene.
+
+        Args:
+            appearances: Character name -> scene numbers they appear in,
+                in screenplay order
+        """
+        for name, scene_numbers in appearances.items():
+            if not scene_numbers:
+                continue
+
+            entity = self.find_entity_by_name(name)
+            if entity is not None:
+                # Already tracked: merge scene by scene
+                for scene_number in scene_numbers:
+                    self.record_appearance(entity.entity_id, scene_number)
+                continue
+
+            entity = self.add_entity(name, EntityType.CHARACTER, scene_numbers[0])
+            for scene_number in dict.fromkeys(scene_numbers[1:]):  # Dedupe, keep order
+                if scene_number not in entity._appearances_set:
+                    entity._appearances_set.add(scene_number)
+                    entity.appearances.append(scene_number)
+                    self._scene_index.setdefault(scene_number, []).append(entity.entity_id)
+            entity.total_appearances = len(entity.appearances)
+            entity.last_appearance = scene_numbers[-1]
+
     def update_all_importance_scores(self, current_scene: int):
-        """Update importance scores for all entities"""
-        for entity in self.entities.values():
-            entity.update_importance(current_scene)
+        """
+        Update importance scores for all entities
+
+        Same formula as Entity.update_importance, computed for every
+        entity at once over per-field arrays.
+        """
+        entities = list(self.entities.values())
+        if not entities:
+            return
+        n = len(entities)
+
+        def column(values):
+            return np.fromiter(values, dtype=np.float64, count=n)
+
+        speaking_lines = column(e.speaking_lines for e in entities)
+        total_appearances = column(e.total_appearances for e in entities)
+        first_appearance = column(e.first_appearance for e in entities)
+        last_appearance = column(e.last_appearance for e in entities)
+        mentions = column(len(e.mentioned_when_absent) for e in entities)
+        relationships = column(len(e.relationships) for e in entities)
+        critical_moments = column(e._critical_moments for e in entities)
+        high_moments = column(e._high_moments for e in entities)
+
+        scores = entity_scores(
+            speaking_lines, total_appearances, first_appearance, last_appearance,
+            current_scene, mentions, relationships, critical_moments, high_moments
+        )
+
+        for entity, score in zip(entities, scores.tolist()):
+            entity.importance_score = score
 
     def get_high_importance_entities(self) -> List[Entity]:
         """Get all high importance entities (>0.7)"""
@@ -236,7 +423,7 @@ class EntityTracker(BaseModel):
 
     def get_entities_in_scene(self, scene_number: int) -> List[Entity]:
         """Get all entities that appear in a scene"""
-        return [e for e in self.entities.values() if scene_number in e.appearances]
+        return [self.entities[entity_id] for entity_id in self._scene_index.get(scene_number, ())]
 
     def get_character_list(self) -> List[str]:
         """Get list of all character names"""
@@ -247,8 +434,9 @@ class EntityTracker(BaseModel):
 
     def get_importance_summary(self) -> Dict[str, List[str]]:
         """Get entities grouped by importance level"""
-        return {
-            "high": [e.name for e in self.entities.values() if e.is_high_importance()],
-            "medium": [e.name for e in self.entities.values() if e.is_medium_importance()],
-            "low": [e.name for e in self.entities.values() if e.is_low_importance()]
-        }
+        # One pass with the same thresholds as is_high/medium/low_importance
+        high, medium, low = [], [], []
+        for e in self.entities.values():
+            score = e.importance_score
+            (high if score > 0.7 else medium if score >= 0.4 else low).append(e.name)
+        return {"high": high, "medium": medium, "low": low}
@@ -1,12 +1,14 @@
 """
 Memory models - sliding window with recent + historical
 """
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
+from typing import Deque, List, Dict, Optional
+from dataclasses import asdict, dataclass, field
+from pydantic import BaseModel, Field, PrivateAttr
 from collections import deque
 
 
-class SceneDigest(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class SceneDigest:
     """
     Compressed scene summary (~20% of original size for plot)
     BUT 100% emotional data preserved
@@ -14,17 +16,17 @@ class SceneDigest(BaseModel):
     scene_id: str
     scene_number: int
     summary: str  # Compressed plot summary
-    characters_present: List[str] = Field(default_factory=list)
-    key_objects: List[str] = Field(default_factory=list)
-    plot_beats: List[str] = Field(default_factory=list)  # revelation, conflict, etc.
+    characters_present: List[str] = field(default_factory=list)
+    key_objects: List[str] = field(default_factory=list)
+    plot_beats: List[str] = field(default_factory=list)  # revelation, conflict, etc.
     importance_score: float = 0.0
 
     # EMOTIONAL DATA - NEVER COMPRESSED
-    emotional_states_by_reviewer: Dict[str, dict] = Field(default_factory=dict)
+    emotional_states_by_reviewer: Dict[str, dict] = field(default_factory=dict)
 
     # QUESTION TRACKING
-    questions_raised: List[str] = Field(default_factory=list)  # Question IDs
-    questions_answered: List[str] = Field(default_factory=list)  # Question IDs
+    questions_raised: List[str] = field(default_factory=list)  # Question IDs
+    questions_answered: List[str] = field(default_factory=list)  # Question IDs
 
 
 class RecentMemory(BaseModel):
@@ -34,7 +36,7 @@ class RecentMemory(BaseModel):
     Uses deque for efficient sliding window
     """
     max_size: int = 5  # Last 5 scenes in detail
-    scenes: List[dict] = Field(default_factory=list)  # Full scene data
+    scenes: Deque[dict] = Field(default_factory=deque)  # Full scene data
 
     def add_scene(self, scene_data: dict):
         """Add scene to recent memory"""
@@ -42,12 +44,12 @@ class RecentMemory(BaseModel):
 
         # If over max size, oldest scene needs to be compressed
         if len(self.scenes) > self.max_size:
-            return self.scenes.pop(0)  # Return oldest for compression
+            return self.scenes.popleft()  # Return oldest for compression
         return None
 
     def get_all_scenes(self) -> List[dict]:
         """Get all recent scenes"""
-        return self.scenes
+        return list(self.scenes)
 
     def get_latest_scene(self) -> Optional[dict]:
         """Get most recent scene"""
@@ -64,24 +66,56 @@ class HistoricalMemory(BaseModel):
     """
     digests: List[SceneDigest] = Field(default_factory=list)
 
+    # scene_id -> digest, for O(1) lookup by scene
+    _by_id: Dict[str, SceneDigest] = PrivateAttr(default_factory=dict)
+
+    # Digests are not modified once added, so their dict form and each
+    # reviewer's emotional journey are built once, in add_digest
+    _digest_dicts: List[dict] = PrivateAttr(default_factory=list)
+    _journeys: Dict[str, List[dict]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context) -> None:
+        """Rebuild the indexes for memories constructed with digests"""
+        for digest in self.digests:
+            self._index_digest(digest)
+
+    def _index_digest(self, digest: SceneDigest) -> None:
+        # First digest for a scene wins, as with the old in-order scan
+        self._by_id.setdefault(digest.scene_id, digest)
+        self._digest_dicts.append(asdict(digest))
+        for reviewer_id, emotional_state in digest.emotional_states_by_reviewer.items():
+            self._journeys.setdefault(reviewer_id, []).append({
+                "scene_number": digest.scene_number,
+                "scene_id": digest.scene_id,
+                "emotional_state": emotional_state
+            })
+
     def add_digest(self, digest: SceneDigest):
         """Add compressed scene digest"""
         self.digests.append(digest)
+        self._index_digest(digest)
 
     def get_all_digests(self) -> List[SceneDigest]:
         """Get all historical digests"""
         return self.digests
 
+    def get_all_digest_dicts(self) -> List[dict]:
+        """Get all historical digests as dicts"""
+        # Copy so callers can't reorder or extend the cached list
+        return list(self._digest_dicts)
+
+    def get_emotional_journey(self, reviewer_id: str) -> List[dict]:
+        """Get a reviewer's emotional state in each historical scene they reviewed"""
+        return list(self._journeys.get(reviewer_id, []))
+
     def get_digest_by_scene(self, scene_id: str) -> Optional[SceneDigest]:
         """Get specific scene digest"""
-        for digest in self.digests:
-            if digest.scene_id == scene_id:
-                return digest
-        return None
+        return self._by_id.get(scene_id)
 
     def get_digests_for_scenes(self, scene_ids: List[str]) -> List[SceneDigest]:
         """Get multiple digests"""
-        return [d for d in self.digests if d.scene_id in scene_ids]
+        wanted = set(scene_ids)
+        return [d for d in self.digests if d.scene_id in wanted]
 
 
 class MemoryManager(BaseModel):
@@ -129,7 +163,7 @@ class MemoryManager(BaseModel):
         """
         return {
             "recent_scenes": self.get_recent_scenes(),
-            "historical_digests": [d.dict() for d in self.get_historical_digests()],
+            "historical_digests": self.historical_memory.get_all_digest_dicts(),
             "total_scenes_processed": self.current_scene_number,
             "recent_count": len(self.recent_memory.scenes),
             "historical_count": len(self.historical_memory.digests)
@@ -157,19 +191,9 @@ class MemoryManager(BaseModel):
 
         Includes their emotional journey through historical scenes
         """
-        # Get all emotional states for this reviewer from historical memory
-        reviewer_emotional_journey = []
-        for digest in self.historical_memory.digests:
-            if reviewer_id in digest.emotional_states_by_reviewer:
-                reviewer_emotional_journey.append({
-                    "scene_number": digest.scene_number,
-                    "scene_id": digest.scene_id,
-                    "emotional_state": digest.emotional_states_by_reviewer[reviewer_id]
-                })
-
         return {
             "recent_scenes": self.get_recent_scenes(),
-            "historical_digests": [d.dict() for d in self.get_historical_digests()],
-            "emotional_journey": reviewer_emotional_journey,
+            "historical_digests": self.historical_memory.get_all_digest_dicts(),
+            "emotional_journey": self.historical_memory.get_emotional_journey(reviewer_id),
             "current_scene": self.current_scene_number
         }
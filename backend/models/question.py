@@ -1,9 +1,13 @@
 """
 Question tracking models - tracks open questions/mysteries
 """
-from typing import List, Dict, Optional
+from typing import Annotated, List, Dict, Optional, Set
+from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
 from enum import Enum
+import heapq
+
+from models._scoring import question_score
 
 
 class QuestionStatus(str, Enum):
@@ -21,11 +25,22 @@ class NarrativeWeight(str, Enum):
     LOW = "low"
 
 
-class Question(BaseModel):
+# Share of the narrative score for each weight
+_NARRATIVE_WEIGHTS = {
+    NarrativeWeight.CRITICAL: 1.0,
+    NarrativeWeight.HIGH: 0.75,
+    NarrativeWeight.MEDIUM: 0.50,
+    NarrativeWeight.LOW: 0.25
+}
+
+
+@dataclass(slots=True, kw_only=True)
+class Question:
     """
     A question/mystery raised during screenplay
 
-    Tracked until answered or proven irrelevant
+    Tracked until answered or proven irrelevant. A slotted dataclass
+    rather than a Pydantic model, since questions are updated every scene.
     """
     question_id: str  # e.g., "Q_047"
     question: str  # The actual question text
@@ -36,8 +51,8 @@ class Question(BaseModel):
     importance_score: float = 0.0  # 0.0 to 1.0
 
     # Tracking
-    references: List[int] = Field(default_factory=list)  # Scenes where question was mentioned/relevant
-    related_entities: List[str] = Field(default_factory=list)  # Entity IDs related to this question
+    references: List[int] = field(default_factory=list)  # Scenes where question was mentioned/relevant
+    related_entities: List[str] = field(default_factory=list)  # Entity IDs related to this question
 
     # Metadata
     narrative_weight: NarrativeWeight = NarrativeWeight.MEDIUM
@@ -50,6 +65,20 @@ class Question(BaseModel):
     became_irrelevant_in_scene: Optional[int] = None
     irrelevant_reason: Optional[str] = None
 
+    # Set view of references for O(1) membership tests
+    # (excluded from Pydantic dumps of QuestionTracker)
+    _references_set: Annotated[Set[int], Field(exclude=True)] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Build the reference set"""
+        self._references_set = set(self.references)
+
+    def is_referenced_in(self, scene_number: int) -> bool:
+        """Check whether the question was referenced in a scene"""
+        return scene_number in self._references_set
+
     def update_importance(self, current_scene: int, entity_tracker=None) -> float:
         """
         Calculate importance score
@@ -61,54 +90,23 @@ class Question(BaseModel):
         - Entity importance (0.15)
         - Urgency (0.15)
         """
-        # Reference count
-        reference_count_score = min(len(self.references) / 5.0, 1.0) * 0.25
-
-        # Duration weight (how long it's been open)
-        if current_scene > self.raised_in_scene:
-            duration = (current_scene - self.raised_in_scene) / current_scene
-            duration_score = duration * 0.15
-        else:
-            duration_score = 0.0
-
-        # Narrative weight
-        narrative_weights = {
-            NarrativeWeight.CRITICAL: 1.0,
-            NarrativeWeight.HIGH: 0.75,
-            NarrativeWeight.MEDIUM: 0.50,
-            NarrativeWeight.LOW: 0.25
-        }
-        narrative_score = narrative_weights[self.narrative_weight] * 0.30
-
         # Entity importance
-        entity_score = 0.0
+        entity_importance = 0.0
         if entity_tracker and self.related_entities:
-            max_entity_importance = max([
-                entity_tracker.get_entity(entity_id).importance_score
-                for entity_id in self.related_entities
-                if entity_tracker.get_entity(entity_id)
-            ] or [0.0])
-            entity_score = max_entity_importance * 0.15
-
-        # Urgency
-        urgency_score = self.urgency * 0.15
-
-        # Recency boost (recently mentioned)
-        recency_boost = 0.0
-        if self.references:
-            last_reference = max(self.references)
-            if (current_scene - last_reference) < 3:
-                recency_boost = 0.10
-
-        total = (reference_count_score + duration_score + narrative_score +
-                entity_score + urgency_score + recency_boost)
-
-        self.importance_score = min(total, 1.0)
+            scores = entity_tracker.get_importance_by_ids(self.related_entities)
+            entity_importance = float(scores.max()) if scores.size else 0.0
+
+        self.importance_score = question_score(
+            len(self.references), self.raised_in_scene, current_scene,
+            _NARRATIVE_WEIGHTS[self.narrative_weight], entity_importance,
+            self.urgency, max(self.references) if self.references else 0
+        )
         return self.importance_score
 
     def add_reference(self, scene_number: int):
         """Mark that this question was mentioned/relevant in a scene"""
-        if scene_number not in self.references:
+        if scene_number not in self._references_set:
+            self._references_set.add(scene_number)
             self.references.append(scene_number)
 
             # Increase urgency if repeatedly referenced but not answered
@@ -181,11 +179,14 @@ class QuestionTracker(BaseModel):
 
     def get_high_importance_questions(self) -> List[Question]:
         """Get all high importance questions (>0.7)"""
-        return [q for q in self.get_open_questions() if q.is_high_importance()]
+        return [
+            q for q in self.questions.values()
+            if q.status == QuestionStatus.OPEN and q.importance_score > 0.7
+        ]
 
     def get_questions_for_scene(self, scene_number: int) -> List[Question]:
         """Get questions that were referenced in a scene"""
-        return [q for q in self.questions.values() if scene_number in q.references]
+        return [q for q in self.questions.values() if q.is_referenced_in(scene_number)]
 
     def get_questions_by_reviewer(self, reviewer_id: str) -> List[Question]:
         """Get all questions raised by a specific reviewer"""
@@ -198,12 +199,14 @@ class QuestionTracker(BaseModel):
 
     def get_importance_summary(self) -> Dict[str, List[str]]:
         """Get questions grouped by importance level"""
-        open_questions = self.get_open_questions()
-        return {
-            "high": [q.question_id for q in open_questions if q.is_high_importance()],
-            "medium": [q.question_id for q in open_questions if q.is_medium_importance()],
-            "low": [q.question_id for q in open_questions if q.is_low_importance()]
-        }
+        # One pass with the same thresholds as is_high/medium/low_importance
+        high, medium, low = [], [], []
+        for q in self.questions.values():
+            if q.status != QuestionStatus.OPEN:
+                continue
+            score = q.importance_score
+            (high if score > 0.7 else medium if score >= 0.4 else low).append(q.question_id)
+        return {"high": high, "medium": medium, "low": low}
 
     def get_status_summary(self) -> Dict[str, int]:
         """Get count of questions by status"""
@@ -219,9 +222,12 @@ class QuestionTracker(BaseModel):
 
         Returns up to max_questions sorted by importance
         """
-        open_questions = self.get_open_questions()
-        open_questions.sort(key=lambda q: q.importance_score, reverse=True)
-        return open_questions[:max_questions]
+        # Top-k selection; same order as a stable descending sort
+        return heapq.nlargest(
+            max_questions,
+            (q for q in self.questions.values() if q.status == QuestionStatus.OPEN),
+            key=lambda q: q.importance_score
+        )
 
     def prune_low_importance(self, threshold: float = 0.2):
         """
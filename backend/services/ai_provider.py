@@ -8,6 +8,8 @@ from typing import Dict, List, Optional
 from pydantic import BaseModel
 import os
 
+from services.anthropic_client import get_anthropic_client
+
 
 class AIMessage(BaseModel):
     """Standard message format across providers"""
@@ -57,15 +59,14 @@ class AnthropicProvider(AIProvider):
 
     def chat(self, messages: List[AIMessage], temperature: float = 0.7, max_tokens: int = 1000) -> AIResponse:
         """Send request to Anthropic API"""
-        try:
-            import anthropic
-        except ImportError:
-            raise ImportError("anthropic package not installed. Run: pip install anthropic")
-
         if not self.api_key:
             raise ValueError("Anthropic API key not found. Set ANTHROPIC_API_KEY environment variable.")
 
-        client = anthropic.Anthropic(api_key=self.api_key)
+        # Shared per API key, so calls reuse warm keep-alive connections
+        try:
+            client = get_anthropic_client(self.api_key)
+        except ImportError:
+            raise ImportError("anthropic package not installed. Run: pip install anthropic")
 
         # Convert messages to Anthropic format
         # Extract system message if present
@@ -0,0 +1,41 @@
+"""
+Shared Anthropic client
+
+One client per API key for the whole process, so every caller reuses the
+same HTTP connection pool (keep-alive) instead of opening its own.
+"""
+import os
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+
+# Long completions (8k-token personas) can take minutes
+DEFAULT_TIMEOUT_SECONDS = 120.0
+
+_clients: Dict[Optional[str], "Anthropic"] = {}
+_clients_lock = threading.Lock()
+
+
+def get_anthropic_client(api_key: Optional[str] = None) -> "Anthropic":
+    """
+    Get the shared Anthropic client for an API key
+
+    Args:
+        api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY)
+
+    Returns:
+        Anthropic client (created on first use, then reused)
+    """
+    api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
+
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            # Imported here so importing this module stays cheap
+            from anthropic import Anthropic
+            client = Anthropic(api_key=api_key, timeout=DEFAULT_TIMEOUT_SECONDS)
+            _clients[api_key] = client
+
+    return client
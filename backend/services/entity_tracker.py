@@ -54,8 +54,8 @@ class EntityTrackingService:
             entity = self.tracker.get_or_create_character(normalized_name, scene.scene_number)
 
             # Add alias if different
-            if normalized_name != char_name and char_name not in entity.aliases:
-                entity.aliases.append(char_name)
+            if normalized_name != char_name:
+                self.tracker.add_alias(entity.entity_id, char_name)
 
             # Count dialogue lines for this character
             dialogue_lines = sum(
@@ -63,7 +63,8 @@ class EntityTrackingService:
                 if elem.type == "dialogue" and self._previous_character_is(scene.elements, elem, char_name)
             )
 
-            entity.add_appearance(
+            self.tracker.record_appearance(
+                entity.entity_id,
                 scene_number=scene.scene_number,
                 spoke=True,
                 lines=dialogue_lines
@@ -77,10 +78,11 @@ class EntityTrackingService:
             entity = self.tracker.get_or_create_character(normalized_name, scene.scene_number)
 
             # Add alias if different
-            if normalized_name != char_name and char_name not in entity.aliases:
-                entity.aliases.append(char_name)
+            if normalized_name != char_name:
+                self.tracker.add_alias(entity.entity_id, char_name)
 
-            entity.add_appearance(
+            self.tracker.record_appearance(
+                entity.entity_id,
                 scene_number=scene.scene_number,
                 spoke=False
             )
@@ -95,7 +97,23 @@ class EntityTrackingService:
                     first_scene=scene.scene_number
                 )
             else:
-                location.add_appearance(scene.scene_number)
+                self.tracker.record_appearance(location.entity_id, scene.scene_number)
+
+        self._record_mentions(scene)
+
+    # Element types whose text can name an entity without it being present
+    _MENTION_ELEMENT_TYPES = frozenset({"action", "dialogue", "parenthetical"})
+
+    def _record_mentions(self, scene: Scene):
+        """Record tracked entities named in the scene's text but not appearing in it"""
+        text = "\n".join(
+            elem.text for elem in scene.elements
+            if elem.type in self._MENTION_ELEMENT_TYPES
+        )
+        for entity_id in self.tracker.find_all_in_text(text):
+            entity = self.tracker.entities[entity_id]
+            if not entity.appears_in(scene.scene_number):
+                entity.mentioned_when_absent.append(scene.scene_number)
 
     def _previous_character_is(self, elements, current_element, char_name: str) -> bool:
         """Check if the previous character element matches the given name"""
@@ -164,7 +182,7 @@ class EntityTrackingService:
 
                         if char1 and char2:
                             # Count shared scenes
-                            shared_scenes = set(char1.appearances) & set(char2.appearances)
+                            shared_scenes = [n for n in char1.appearances if char2.appears_in(n)]
 
                             # If they appear together frequently, they have a relationship
                             if len(shared_scenes) >= 2:
@@ -0,0 +1,56 @@
+"""
+Fast JSON encode/decode
+
+Uses orjson when it's installed (several times faster than the stdlib on
+large model replies and cache entries) and falls back to json otherwise.
+Decode errors are json.JSONDecodeError either way (orjson's error type
+subclasses it), so callers keep catching the stdlib exception.
+"""
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from str or UTF-8 bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to a compact JSON string"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def dumps_indented(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize obj to JSON indented by two spaces (for logs and debugging)
+
+    Args:
+        obj: Value to serialize
+        default: Called for objects JSON can't represent (e.g. str)
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; the stdlib handles those
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=default)
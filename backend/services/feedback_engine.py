@@ -265,7 +265,7 @@ class FeedbackEngine:
         context = {}
 
         # Recent memory
-        context['recent_scenes'] = self.memory.recent_memory.scenes
+        context['recent_scenes'] = self.memory.get_recent_scenes()
 
         # Historical summaries
         context['earlier_summaries'] = [
@@ -0,0 +1,70 @@
+"""
+File output helpers
+
+Writes generated documents (personas, reports, transcripts) with as few
+syscalls as possible: the text is encoded once and handed to the kernel
+in a single write on a raw file descriptor (or a memory map for large
+batch outputs).
+"""
+import mmap
+import os
+import tempfile
+
+# Documents at least this large are written through a memory map, which
+# copies straight into the page cache and skips the write() buffer copy
+MMAP_WRITE_THRESHOLD = 64 * 1024
+
+
+def write_text_file(path, text: str, atomic: bool = False) -> None:
+    """
+    Write text to path as UTF-8, replacing any existing file
+
+    Args:
+        path: Destination file path (str or Path)
+        text: Document text
+        atomic: Write to a temp file in the same directory, then rename it
+            over path, so a crash never leaves a half-written file
+    """
+    data = text.encode('utf-8')
+
+    if atomic:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+        os.close(fd)
+        try:
+            _write_bytes(tmp_path, data)
+            os.chmod(tmp_path, 0o644)  # mkstemp creates 0600
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return
+
+    _write_bytes(path, data)
+
+
+def _write_bytes(path, data: bytes) -> None:
+    if len(data) >= MMAP_WRITE_THRESHOLD:
+        _write_mmap(path, data)
+        return
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            # os.write may write less than requested; finish the remainder
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _write_mmap(path, data: bytes) -> None:
+    """Size the file up front, then copy the bytes in through a shared mapping"""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.ftruncate(fd, len(data))
+        with mmap.mmap(fd, len(data)) as mapped:
+            mapped[:] = data
+            mapped.flush()
+    finally:
+        os.close(fd)
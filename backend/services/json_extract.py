@@ -0,0 +1,117 @@
+"""
+JSON extraction from LLM responses
+
+Models often wrap the requested JSON in prose ("Here's the analysis: {...}
+Let me know if..."). This pulls out the first complete JSON value in a
+single left-to-right scan, without regex backtracking.
+
+JSONStreamScanner does the same scan incrementally over a streamed
+response, handing back each top-level element of the value as soon as it
+closes and reporting when the value itself is complete.
+"""
+from typing import List, Optional
+
+
+class JSONStreamScanner:
+    """
+    Incremental scanner for the first JSON object/array in a text stream
+
+    Usage:
+        scanner = JSONStreamScanner("[]")
+        for chunk in stream:
+            for item in scanner.feed(chunk):
+                handle(json.loads(item))
+            if scanner.done:
+                break
+        full_value = scanner.value
+    """
+
+    def __init__(self, brackets: str = "{}"):
+        """
+        Args:
+            brackets: Opening/closing pair to match ("{}" for objects, "[]" for arrays)
+        """
+        self.opening, self.closing = brackets
+        self.value: Optional[str] = None  # Set once the value is complete
+
+        self._text = ""
+        self._pos = 0
+        self._start = -1
+        self._item_start = -1
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def done(self) -> bool:
+        """True once the outermost value has closed"""
+        return self.value is not None
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Scan the next chunk of text
+
+        Returns:
+            JSON text of each top-level element (object or array) that
+            completed within this chunk
+        """
+        if self.done:
+            return []
+
+        self._text += chunk
+        text = self._text
+        completed = []
+
+        if self._start == -1:
+            self._start = text.find(self.opening, self._pos)
+            if self._start == -1:
+                self._pos = len(text)
+                return completed
+            self._pos = self._start
+
+        for i in range(self._pos, len(text)):
+            char = text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+                if self._depth == 2:
+                    self._item_start = i
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 1:
+                    completed.append(text[self._item_start:i + 1])
+                elif self._depth == 0:
+                    self.value = text[self._start:i + 1]
+                    break
+
+        self._pos = len(text)
+        return completed
+
+
+def extract_first_json_object(text: str, brackets: str = "{}") -> Optional[str]:
+    """
+    Find the first balanced JSON object (or array) in text
+
+    Tracks nesting depth and string state, so braces inside string values
+    and escaped quotes don't end the object early, and trailing prose after
+    the closing brace is ignored.
+
+    Args:
+        text: Model response text
+        brackets: Opening/closing pair to match ("{}" for objects, "[]" for arrays)
+
+    Returns:
+        The JSON substring, or None if no complete value is found
+    """
+    scanner = JSONStreamScanner(brackets)
+    scanner.feed(text)
+    return scanner.value
@@ -0,0 +1,117 @@
+"""
+LLM response cache
+
+Deterministic, content-addressed cache for AI responses so identical
+prompts don't re-hit the API during iteration (e.g. brain rebuilds).
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Protocol
+
+from services import fast_json
+
+
+def make_cache_key(**parts: Any) -> str:
+    """
+    Build a stable SHA-256 key from keyword parts
+
+    Example:
+        make_cache_key(model="claude-...", prompt=prompt, v=1)
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """Minimal interface every cache backend implements"""
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        ...
+
+
+class MemoryCache:
+    """
+    In-process cache (lost when the process exits)
+
+    With maxsize set, the least recently used entry is evicted once the
+    cache holds more than maxsize entries.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self.maxsize = maxsize
+        self._store: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and time.time() > expires_at:
+            del self._store[key]
+            return None
+
+        self._store.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        self._store[key] = (expires_at, value)
+        self._store.move_to_end(key)
+        if self.maxsize is not None and len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+
+class DiskCache:
+    """
+    JSON-file cache stored under a directory, one file per key
+
+    Writes are atomic (temp file + os.replace) so concurrent runs never
+    see a half-written entry.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/llm"):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = fast_json.loads(f.read())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        expires_at = entry.get('expires_at')
+        if expires_at is not None and time.time() > expires_at:
+            path.unlink(missing_ok=True)
+            return None
+
+        return entry.get('value')
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {
+            'expires_at': time.time() + ttl if ttl else None,
+            'value': value
+        }
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(fast_json.dumps_bytes(entry))
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -44,7 +44,7 @@ class FountainParser:
         self.in_title_page = True
         self.title_page_data = {}
 
-    def parse_file(self, filepath: str, max_pages: int = None) -> Screenplay:
+    def parse_file(self, filepath: str, max_pages: int = None, pdf_extractor=None) -> Screenplay:
         """
         Parse a screenplay file into a Screenplay object
 
@@ -56,6 +56,8 @@ class FountainParser:
         Args:
             filepath: Path to file
             max_pages: For PDFs, max pages to extract (None = all)
+            pdf_extractor: PDF text extractor to use (default: uncached
+                PDFExtractor, so uploaded screenplays are not retained)
 
         Returns:
             Screenplay object
@@ -64,8 +66,10 @@ class FountainParser:
 
         if filepath_lower.endswith('.pdf'):
             # Extract text from PDF
-            from services.pdf_extractor import PDFExtractor
-            extractor = PDFExtractor()
+            if pdf_extractor is None:
+                from services.pdf_extractor import PDFExtractor
+                pdf_extractor = PDFExtractor()
+            extractor = pdf_extractor
             result = extractor.extract_with_metadata(filepath, max_pages=max_pages)
             content = result['text']
 
@@ -1,7 +1,12 @@
 """
 PDF text extraction for screenplays
 """
+import hashlib
+import json
+import mmap
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 backend_path = Path(__file__).parent.parent
@@ -130,3 +135,86 @@ class PDFExtractor:
             'total_pages': total_pages,
             'extracted_pages': extracted_pages
         }
+
+
+# Absolute, so the cache doesn't depend on the working directory
+DEFAULT_PDF_CACHE_DIR = str(Path.home() / ".cache" / "brain_builder" / "pdf_text")
+
+
+class CachedPDFExtractor(PDFExtractor):
+    """
+    PDFExtractor with a content-addressed on-disk cache
+
+    Extracted text is keyed by SHA-256 of the PDF bytes plus extractor
+    settings, so re-running on the same file skips PDF parsing entirely.
+    """
+
+    # Bump when extraction logic changes to invalidate cached text
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_dir: str = DEFAULT_PDF_CACHE_DIR):
+        super().__init__()
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def _file_hash(pdf_path: str) -> str:
+        """SHA-256 of the file contents (memory-mapped to avoid a full read copy)"""
+        digest = hashlib.sha256()
+        with open(pdf_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return digest.hexdigest()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        return digest.hexdigest()
+
+    def _cache_path(self, pdf_path: str, max_pages: int, prefer_pdfplumber: bool) -> Path:
+        method = "pdfplumber" if prefer_pdfplumber and pdfplumber else "pypdf"
+        pages = max_pages if max_pages else "all"
+        key = f"{self._file_hash(pdf_path)}-v{self.CACHE_VERSION}-{method}-{pages}"
+        return self.cache_dir / f"{key}.json"
+
+    def _read_cache(self, cache_path: Path):
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write_cache(self, cache_path: Path, data: dict) -> None:
+        """Atomically write cache entry (temp file + os.replace)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def extract_text(self, pdf_path: str, max_pages: int = None, prefer_pdfplumber: bool = True) -> str:
+        """Extract text from PDF, using the cache when the file is unchanged"""
+        cache_path = self._cache_path(pdf_path, max_pages, prefer_pdfplumber)
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            return cached['text']
+
+        text = super().extract_text(pdf_path, max_pages, prefer_pdfplumber)
+        self._write_cache(cache_path, {'text': text})
+        return text
+
+    def extract_with_metadata(self, pdf_path: str, max_pages: int = None) -> dict:
+        """Extract text and metadata, caching the page counts alongside the text"""
+        cache_path = self._cache_path(pdf_path, max_pages, True)
+        cached = self._read_cache(cache_path)
+        if cached is not None and 'total_pages' in cached:
+            return {
+                'text': cached['text'],
+                'total_pages': cached['total_pages'],
+                'extracted_pages': cached['extracted_pages']
+            }
+
+        result = super().extract_with_metadata(pdf_path, max_pages)
+        self._write_cache(cache_path, result)
+        return result
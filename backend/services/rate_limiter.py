@@ -0,0 +1,57 @@
+"""
+Request rate limiting
+
+Token bucket shared by concurrent API callers, so a burst of parallel
+requests stays under the provider's requests-per-minute cap instead of
+tripping 429s and falling into retry backoff.
+"""
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket allowing `rate` requests per `period` seconds
+
+    Bursts of up to `rate` requests go through immediately; after that,
+    each caller is handed a slot in the future and sleeps until it.
+
+    Usage:
+        limiter = RateLimiter(50, 60)   # 50 requests/minute
+        await limiter.acquire()
+    """
+
+    def __init__(self, rate: int, period: float = 60.0):
+        """
+        Args:
+            rate: Requests allowed per period
+            period: Period length in seconds
+        """
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        # A thread lock (not asyncio.Lock) so one limiter works across
+        # event loops and worker threads; it's never held across an await
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            refill = (now - self._updated) * self.rate / self.period
+            self._tokens = min(float(self.rate), self._tokens + refill)
+            self._updated = now
+
+            # Going negative queues the caller behind earlier reservations
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self.period / self.rate
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,169 @@
+"""
+Semantic LLM response cache
+
+Near-duplicate prompts (same template, slightly different source text)
+return the cached response instead of hitting the API. Prompts are
+embedded locally with hashed word/bigram features (no model download,
+no extra API call) and matched by cosine similarity.
+
+Entries are partitioned by namespace (e.g. "insights:Jordan Peele") so
+a near-identical prompt for a *different* director never matches.
+"""
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+
+def embed_text(text: str, dim: int = 1024) -> np.ndarray:
+    """
+    Hashed bag-of-words + bigrams, L2-normalized
+
+    Stable across processes (crc32, not hash()), so persisted embeddings
+    stay comparable between runs.
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+
+    for token in tokens:
+        vector[zlib.crc32(token.encode('utf-8')) % dim] += 1.0
+    for first, second in zip(tokens, tokens[1:]):
+        vector[zlib.crc32(f"{first} {second}".encode('utf-8')) % dim] += 1.0
+
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+class SemanticCache:
+    """
+    Cosine-similarity cache over prompt embeddings
+
+    Usage:
+        cache = SemanticCache("research_cache.sqlite3")
+        hit = cache.get("insights:Jordan Peele", prompt)
+        if hit is None:
+            hit = call_api(prompt)
+            cache.set("insights:Jordan Peele", prompt, hit)
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        threshold: float = 0.97,
+        max_entries: int = 1000,
+        dim: int = 1024
+    ):
+        """
+        Args:
+            db_path: SQLite file for persistence (None = in-memory only)
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Least-recently-used entries are evicted past this
+            dim: Embedding dimensionality
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.dim = dim
+        self._lock = threading.Lock()
+
+        # Parallel arrays; row i of _matrix is the embedding for _ids[i]
+        self._ids: List[int] = []
+        self._namespaces: List[str] = []
+        self._values: List[Any] = []
+        self._last_used: List[float] = []
+        self._matrix = np.zeros((0, dim), dtype=np.float32)
+
+        self._db = sqlite3.connect(db_path or ":memory:", check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "id INTEGER PRIMARY KEY, namespace TEXT, embedding BLOB, "
+            "value TEXT, last_used REAL)"
+        )
+        self._load()
+
+    def _load(self) -> None:
+        rows = self._db.execute(
+            "SELECT id, namespace, embedding, value, last_used FROM entries"
+        ).fetchall()
+        embeddings = []
+        for row_id, namespace, embedding, value, last_used in rows:
+            vector = np.frombuffer(embedding, dtype=np.float32)
+            if vector.shape[0] != self.dim:
+                continue  # Stored with a different dimensionality
+            self._ids.append(row_id)
+            self._namespaces.append(namespace)
+            self._values.append(json.loads(value))
+            self._last_used.append(last_used)
+            embeddings.append(vector)
+        if embeddings:
+            self._matrix = np.vstack(embeddings)
+
+    def get(self, namespace: str, prompt: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for the most similar prompt, if similar enough"""
+        query = embed_text(prompt, self.dim)
+
+        with self._lock:
+            if not self._ids:
+                return None
+
+            # Rows are unit vectors, so the dot product is cosine similarity
+            scores = self._matrix @ query
+            mask = np.fromiter(
+                (ns == namespace for ns in self._namespaces),
+                dtype=bool,
+                count=len(self._namespaces)
+            )
+            scores[~mask] = -1.0
+
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+
+            now = time.time()
+            self._last_used[best] = now
+            self._db.execute(
+                "UPDATE entries SET last_used = ? WHERE id = ?",
+                (now, self._ids[best])
+            )
+            self._db.commit()
+            return self._values[best]
+
+    def set(self, namespace: str, prompt: str, value: Dict[str, Any]) -> None:
+        """Store value for prompt (evicting the least recently used entry if full)"""
+        embedding = embed_text(prompt, self.dim)
+        now = time.time()
+
+        with self._lock:
+            if len(self._ids) >= self.max_entries:
+                self._evict_lru()
+
+            cursor = self._db.execute(
+                "INSERT INTO entries (namespace, embedding, value, last_used) VALUES (?, ?, ?, ?)",
+                (namespace, embedding.tobytes(), json.dumps(value), now)
+            )
+            self._db.commit()
+
+            self._ids.append(cursor.lastrowid)
+            self._namespaces.append(namespace)
+            self._values.append(value)
+            self._last_used.append(now)
+            self._matrix = np.vstack([self._matrix, embedding])
+
+    def _evict_lru(self) -> None:
+        oldest = min(range(len(self._last_used)), key=self._last_used.__getitem__)
+        self._db.execute("DELETE FROM entries WHERE id = ?", (self._ids[oldest],))
+
+        for column in (self._ids, self._namespaces, self._values, self._last_used):
+            del column[oldest]
+        self._matrix = np.delete(self._matrix, oldest, axis=0)
+
+    def __len__(self) -> int:
+        return len(self._ids)
@@ -0,0 +1,180 @@
+"""
+Source cluster cache
+
+Sources of the same type about the same director (e.g. a dozen junket
+interviews) often say nearly the same thing. Each analyzed source is
+remembered by a MinHash signature of its word 3-shingles along with the
+insights extracted from it, so a new source can:
+
+- reuse a near-identical source's insights outright (no API call), or
+- borrow a similar source's insights as a one-shot example, which keeps
+  the reply consistent in structure and granularity with earlier ones.
+
+Signatures are persisted per director as JSON next to the other caches.
+"""
+import json
+import os
+import re
+import tempfile
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+# Prime just above 2**32 for the (a*x + b) mod p hash family; a < 2**31
+# keeps a*x inside uint64
+_HASH_PRIME = np.uint64(4294967311)
+
+
+@dataclass
+class ClusterMatch:
+    """Closest previously analyzed source"""
+    similarity: float
+    insights: Dict[str, Any]
+
+
+class SourceClusterCache:
+    """
+    MinHash index of analyzed sources and their extracted insights
+
+    Usage:
+        clusters = SourceClusterCache(".cache/source_clusters")
+        match = clusters.find("Jordan Peele", "interview", content)
+        if match and match.similarity >= 0.95:
+            insights = match.insights
+        ...
+        clusters.add("Jordan Peele", "interview", content, insights)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        num_perm: int = 128,
+        shingle_size: int = 3,
+        seed: int = 1
+    ):
+        """
+        Args:
+            cache_dir: Directory for per-director JSON files (None = memory only)
+            num_perm: MinHash signature length
+            shingle_size: Words per shingle
+            seed: Hash family seed (must match between runs sharing a cache)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.shingle_size = shingle_size
+        self._lock = threading.Lock()
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 2**31, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, 2**31, size=num_perm).astype(np.uint64)
+
+        # director -> (source types, signature matrix, insights)
+        self._directors: Dict[str, Tuple[List[str], np.ndarray, List[Dict[str, Any]]]] = {}
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature of text's word shingles"""
+        words = _WORD.findall(text.lower())
+        n = self.shingle_size
+        shingles = {' '.join(words[i:i + n]) for i in range(max(len(words) - n + 1, 1))}
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode('utf-8')) for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        # One row per hash function, min over shingles
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _HASH_PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def find(self, director_name: str, source_type: str, content: str) -> Optional[ClusterMatch]:
+        """Most similar analyzed source of the same type, if any"""
+        query = self.signature(content)
+
+        with self._lock:
+            source_types, matrix, insights = self._load(director_name)
+            if not source_types:
+                return None
+
+            # Fraction of matching MinHash slots estimates Jaccard similarity
+            scores = (matrix == query).mean(axis=1)
+            scores[np.array(source_types) != source_type] = -1.0
+
+            best = int(np.argmax(scores))
+            if scores[best] < 0:
+                return None
+            return ClusterMatch(similarity=float(scores[best]), insights=insights[best])
+
+    def add(self, director_name: str, source_type: str, content: str, insights: Dict[str, Any]) -> None:
+        """Remember a source's insights"""
+        self.add_many(director_name, [(source_type, content, insights)])
+
+    def add_many(
+        self,
+        director_name: str,
+        entries: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> None:
+        """Remember several (source_type, content, insights) entries, saving once"""
+        if not entries:
+            return
+        signatures = [self.signature(content) for _, content, _ in entries]
+
+        with self._lock:
+            source_types, matrix, all_insights = self._load(director_name)
+            source_types.extend(source_type for source_type, _, _ in entries)
+            all_insights.extend(insights for _, _, insights in entries)
+            matrix = np.vstack([matrix, *signatures])
+            self._directors[director_name] = (source_types, matrix, all_insights)
+            self._save(director_name)
+
+    def _path(self, director_name: str) -> Path:
+        slug = re.sub(r'[^a-zA-Z0-9_-]', '_', director_name)
+        return self.cache_dir / f"{slug}.json"
+
+    def _load(self, director_name: str) -> Tuple[List[str], np.ndarray, List[Dict[str, Any]]]:
+        if director_name in self._directors:
+            return self._directors[director_name]
+
+        entry = ([], np.zeros((0, len(self._a)), dtype=np.uint32), [])
+        if self.cache_dir is not None:
+            try:
+                with open(self._path(director_name), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('num_perm') == len(self._a) and data['entries']:
+                    entry = (
+                        [e['source_type'] for e in data['entries']],
+                        np.array([e['signature'] for e in data['entries']], dtype=np.uint32),
+                        [e['insights'] for e in data['entries']]
+                    )
+            except (FileNotFoundError, json.JSONDecodeError, KeyError):
+                pass
+
+        self._directors[director_name] = entry
+        return entry
+
+    def _save(self, director_name: str) -> None:
+        if self.cache_dir is None:
+            return
+
+        source_types, matrix, insights = self._directors[director_name]
+        data = {
+            'num_perm': len(self._a),
+            'entries': [
+                {'source_type': t, 'signature': row.tolist(), 'insights': i}
+                for t, row, i in zip(source_types, matrix, insights)
+            ]
+        }
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._path(director_name))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
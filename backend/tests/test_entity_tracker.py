@@ -9,6 +9,7 @@ sys.path.insert(0, str(backend_path))
 
 from services.parser import FountainParser
 from services.entity_tracker import EntityTrackingService
+from models.entity import EntityTracker, EntityType
 
 
 def test_entity_tracker():
@@ -127,5 +128,76 @@ def test_entity_tracker():
     print("\n✓ All assertions passed!")
 
 
+def test_bulk_load_characters():
+    """bulk_load_characters matches per-scene get_or_create_character + record_appearance"""
+
+    parser = FountainParser()
+    test_file = Path(__file__).parent / 'test_screenplay.fountain'
+    screenplay = parser.parse_file(str(test_file))
+
+    one_by_one = EntityTracker()
+    appearances = {}
+    for scene in screenplay.scenes:
+        for name in scene.characters_present:
+            entity = one_by_one.get_or_create_character(name, scene.scene_number)
+            one_by_one.record_appearance(entity.entity_id, scene.scene_number)
+            appearances.setdefault(name, []).append(scene.scene_number)
+
+    bulk = EntityTracker()
+    bulk.bulk_load_characters(appearances)
+
+    assert bulk.entities.keys() == one_by_one.entities.keys()
+    for entity_id, expected in one_by_one.entities.items():
+        assert bulk.entities[entity_id] == expected, f"{expected.name} differs"
+
+    for scene in screenplay.scenes:
+        expected_ids = {e.entity_id for e in one_by_one.get_entities_in_scene(scene.scene_number)}
+        assert {e.entity_id for e in bulk.get_entities_in_scene(scene.scene_number)} == expected_ids
+
+    print("✓ Bulk load matches per-scene tracking")
+
+
+def test_find_all_in_text():
+    """find_all_in_text matches whole-word names and aliases, case-insensitively"""
+
+    tracker = EntityTracker()
+    maria = tracker.add_entity("MARIA", EntityType.CHARACTER, 1)
+    will = tracker.add_entity("WILL", EntityType.CHARACTER, 1)
+    tracker.add_entity("JOHN", EntityType.CHARACTER, 2)
+
+    assert tracker.find_all_in_text("Maria waits by the willow.") == {maria.entity_id}
+
+    # Aliases added later are picked up
+    tracker.add_alias(maria.entity_id, "THE MAID")
+    found = tracker.find_all_in_text("The maid hands Will the letter.")
+    assert found == {maria.entity_id, will.entity_id}
+
+    assert tracker.find_all_in_text("Nobody here.") == set()
+    assert EntityTracker().find_all_in_text("MARIA") == set()
+
+    print("✓ Name matcher finds tracked entities in text")
+
+
+
+def test_mentions_when_absent():
+    """Characters named in a scene they don't appear in are recorded as mentioned"""
+
+    parser = FountainParser()
+    screenplay = parser.parse_file(str(Path(__file__).parent / 'test_screenplay.fountain'))
+    tracker = EntityTrackingService().process_screenplay(screenplay)
+
+    maria = tracker.find_entity_by_name("MARIA")
+    john = tracker.find_entity_by_name("JOHN")
+    assert maria.mentioned_when_absent == [3]
+    assert john.mentioned_when_absent == [4]
+    for entity in tracker.entities.values():
+        assert not any(entity.appears_in(n) for n in entity.mentioned_when_absent)
+
+    print("✓ Mentions of absent characters recorded")
+
+
 if __name__ == "__main__":
     test_entity_tracker()
+    test_bulk_load_characters()
+    test_find_all_in_text()
+    test_mentions_when_absent()
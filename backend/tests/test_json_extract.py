@@ -0,0 +1,73 @@
+"""
+Test JSON extraction from model responses
+"""
+import json
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from services.json_extract import JSONStreamScanner, extract_first_json_object
+
+
+def test_brackets_inside_strings():
+    """Braces and brackets inside string values don't change nesting"""
+    text = '{"quote": "a } b ] c { d [", "n": 1}'
+    assert extract_first_json_object(text) == text
+    assert json.loads(extract_first_json_object(text))["n"] == 1
+
+
+def test_escaped_quotes():
+    """Escaped quotes don't end a string early"""
+    text = r'{"quote": "He said \"}\" and left", "ok": true}'
+    assert json.loads(extract_first_json_object(text)) == {"quote": 'He said "}" and left', "ok": True}
+
+
+def test_prose_around_json():
+    """Prose before and after the value is ignored"""
+    text = 'Here is the analysis:\n{"themes": ["dread"]}\nLet me know if you need more {details}.'
+    assert extract_first_json_object(text) == '{"themes": ["dread"]}'
+    assert extract_first_json_object('Sure: [1, [2]] done', brackets="[]") == '[1, [2]]'
+
+
+def test_value_split_across_chunks():
+    """A value (and a string inside it) split across feed() calls still completes"""
+    scanner = JSONStreamScanner()
+    assert scanner.feed('Result: {"a": "x}') == []
+    assert not scanner.done
+    scanner.feed(' \\"y')
+    assert not scanner.done
+    scanner.feed('", "b": 2} trailing')
+    assert scanner.done
+    assert json.loads(scanner.value) == {"a": 'x} "y', "b": 2}
+    assert scanner.feed('{"c": 3}') == []
+
+
+def test_array_mode_yields_each_item():
+    """In [] mode each top-level element is returned as soon as it closes"""
+    scanner = JSONStreamScanner("[]")
+    items = []
+    for chunk in ['Insights: [{"a": 1}, {"b": ', '"]"}', ', [3]', ']']:
+        items.extend(scanner.feed(chunk))
+    assert [json.loads(item) for item in items] == [{"a": 1}, {"b": "]"}, [3]]
+    assert scanner.done
+    assert json.loads(scanner.value) == [{"a": 1}, {"b": "]"}, [3]]
+
+
+def test_truncated_input_returns_none():
+    """An unterminated value (or no value at all) gives None"""
+    assert extract_first_json_object('{"a": {"b": 1}') is None
+    assert extract_first_json_object('{"a": "unterminated }') is None
+    assert extract_first_json_object('no json here') is None
+
+
+if __name__ == "__main__":
+    test_brackets_inside_strings()
+    test_escaped_quotes()
+    test_prose_around_json()
+    test_value_split_across_chunks()
+    test_array_mode_yields_each_item()
+    test_truncated_input_returns_none()
+    print("✓ All JSON extraction tests passed")
@@ -0,0 +1,69 @@
+"""
+Test LLM response cache
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from services.llm_cache import DiskCache, MemoryCache, make_cache_key
+
+
+def test_cache_key_is_stable():
+    """Same parts (in any order) produce the same key"""
+    key_a = make_cache_key(model="claude", prompt="hello", v=1)
+    key_b = make_cache_key(v=1, prompt="hello", model="claude")
+    key_c = make_cache_key(model="claude", prompt="hello", v=2)
+
+    assert key_a == key_b
+    assert key_a != key_c
+
+
+def test_memory_cache_roundtrip():
+    """Memory cache returns stored values and honors TTL"""
+    cache = MemoryCache()
+    assert cache.get("missing") is None
+
+    cache.set("k", {"text": "persona"})
+    assert cache.get("k") == {"text": "persona"}
+
+    cache.set("expired", {"text": "old"}, ttl=-1)
+    assert cache.get("expired") is None
+
+
+def test_memory_cache_maxsize():
+    """Bounded memory cache evicts the least recently used entry"""
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", {"text": "1"})
+    cache.set("b", {"text": "2"})
+    assert cache.get("a") == {"text": "1"}
+
+    cache.set("c", {"text": "3"})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"text": "1"}
+    assert cache.get("c") == {"text": "3"}
+
+
+def test_disk_cache_roundtrip():
+    """Disk cache persists values across instances"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = DiskCache(tmp_dir)
+        assert cache.get("missing") is None
+
+        cache.set("k", {"text": "persona"})
+        assert DiskCache(tmp_dir).get("k") == {"text": "persona"}
+
+        cache.set("expired", {"text": "old"}, ttl=-1)
+        assert cache.get("expired") is None
+        assert not (Path(tmp_dir) / "expired.json").exists()
+
+
+if __name__ == "__main__":
+    test_cache_key_is_stable()
+    test_memory_cache_roundtrip()
+    test_memory_cache_maxsize()
+    test_disk_cache_roundtrip()
+    print("✓ All LLM cache tests passed")
@@ -2,12 +2,13 @@
 Test PDF extraction - SAFE (only first 2 pages)
 """
 import sys
+import tempfile
 from pathlib import Path
 
 backend_path = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_path))
 
-from services.pdf_extractor import PDFExtractor
+from services.pdf_extractor import PDFExtractor, CachedPDFExtractor
 
 
 def test_pdf_extraction():
@@ -58,5 +59,33 @@ def test_pdf_extraction():
         print(f"\n✗ Error extracting PDF: {e}")
 
 
+def test_cached_pdf_extraction():
+    """Cached extractor returns the same result and reuses it on the second call"""
+
+    pdf_path = Path(__file__).parent.parent.parent / "SAMPLES" / "Screenplays" / "Bad Hombres by Filup Molina.pdf"
+
+    if not pdf_path.exists():
+        print(f"\n✗ PDF not found at: {pdf_path}")
+        return
+
+    try:
+        expected = PDFExtractor().extract_with_metadata(str(pdf_path), max_pages=2)
+    except ImportError as e:
+        print(f"\n✗ Error: {e}")
+        return
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        extractor = CachedPDFExtractor(cache_dir=cache_dir)
+
+        first = extractor.extract_with_metadata(str(pdf_path), max_pages=2)
+        assert first == expected
+        assert len(list(Path(cache_dir).glob("*.json"))) == 1
+
+        second = extractor.extract_with_metadata(str(pdf_path), max_pages=2)
+        assert second == expected
+        assert extractor.extract_text(str(pdf_path), max_pages=2) == expected['text']
+
+
 if __name__ == "__main__":
     test_pdf_extraction()
+    test_cached_pdf_extraction()
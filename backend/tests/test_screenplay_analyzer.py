@@ -0,0 +1,65 @@
+"""
+Test screenplay pattern analyzer
+"""
+import sys
+import threading
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from brain_builder.screenplay_analyzer import ScreenplayPatternAnalyzer
+
+TEST_FILE = str(Path(__file__).parent / 'test_screenplay.fountain')
+
+
+def test_analyze_screenplay():
+    """Single screenplay is parsed and its patterns extracted"""
+    analyzer = ScreenplayPatternAnalyzer()
+    analysis = analyzer.analyze_screenplay(TEST_FILE, "Test Director")
+
+    assert analysis.director_name == "Test Director"
+    assert analysis.screenplays_analyzed == ["The Forgotten Maid"]
+    assert analysis.structural.total_scenes == 5
+    assert analysis.structural.avg_scene_length > 0
+    assert analysis.dialogue.avg_dialogue_length > 0
+    assert analysis.character.introduction_style == "immediate (scene 1)"
+    assert analysis.notable_techniques
+
+
+def test_analyze_multiple_screenplays():
+    """Worker-process analysis aggregates in input order"""
+    analyzer = ScreenplayPatternAnalyzer()
+    single = analyzer.analyze_screenplay(TEST_FILE, "Test Director")
+    analysis = analyzer.analyze_multiple_screenplays(
+        [TEST_FILE, TEST_FILE],
+        "Test Director",
+        max_workers=2
+    )
+
+    assert analysis.screenplays_analyzed == ["The Forgotten Maid", "The Forgotten Maid"]
+    assert analysis.structural.avg_scene_length == single.structural.avg_scene_length
+    assert analysis.notable_techniques == single.notable_techniques
+
+
+def test_analyze_multiple_screenplays_from_thread():
+    """Worker pool also starts from a non-main thread (as build_brain_async runs it)"""
+    analyzer = ScreenplayPatternAnalyzer()
+    results = []
+
+    thread = threading.Thread(target=lambda: results.append(
+        analyzer.analyze_multiple_screenplays([TEST_FILE, TEST_FILE], "Test Director", max_workers=2)
+    ))
+    thread.start()
+    thread.join(timeout=120)
+
+    assert not thread.is_alive(), "worker pool hung"
+    assert results[0].screenplays_analyzed == ["The Forgotten Maid", "The Forgotten Maid"]
+
+
+if __name__ == "__main__":
+    test_analyze_screenplay()
+    test_analyze_multiple_screenplays()
+    test_analyze_multiple_screenplays_from_thread()
+    print("✓ All screenplay analyzer tests passed")
@@ -0,0 +1,62 @@
+"""
+Test semantic LLM response cache
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from services.semantic_cache import SemanticCache
+
+
+PROMPT = """Analyze this interview about Jordan Peele and extract key insights.
+
+Source: Fresh Air interview
+Content: I think of horror as a way to talk about fears we can't say out loud.
+The sunken place is about marginalization, about being silenced while the
+world keeps going. Comedy and horror are cousins; both depend on timing."""
+
+
+def test_near_duplicate_prompt_hits():
+    """A prompt differing by trivial whitespace/punctuation is a hit"""
+    cache = SemanticCache(threshold=0.97)
+    cache.set("insights:Jordan Peele", PROMPT, {"quotes": ["horror as a way to talk"]})
+
+    near_duplicate = PROMPT.replace("  ", " ").replace(";", ",") + "\n"
+    assert cache.get("insights:Jordan Peele", near_duplicate) == {"quotes": ["horror as a way to talk"]}
+
+
+def test_different_prompt_misses():
+    """Unrelated content and other namespaces never hit"""
+    cache = SemanticCache(threshold=0.97)
+    cache.set("insights:Jordan Peele", PROMPT, {"quotes": ["x"]})
+
+    assert cache.get("insights:Jordan Peele", "Sam Raimi on the Evil Dead shaky cam") is None
+    assert cache.get("insights:Sam Raimi", PROMPT) is None
+
+
+def test_lru_eviction_and_persistence():
+    """Oldest entry is evicted past max_entries; entries survive reopen"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = str(Path(tmp_dir) / "cache.sqlite3")
+
+        cache = SemanticCache(db_path, max_entries=2)
+        cache.set("ns", "first prompt about pacing", {"v": 1})
+        cache.set("ns", "second prompt about dialogue", {"v": 2})
+        cache.set("ns", "third prompt about monsters", {"v": 3})
+        assert len(cache) == 2
+        assert cache.get("ns", "first prompt about pacing") is None
+
+        reopened = SemanticCache(db_path, max_entries=2)
+        assert len(reopened) == 2
+        assert reopened.get("ns", "third prompt about monsters") == {"v": 3}
+
+
+if __name__ == "__main__":
+    test_near_duplicate_prompt_hits()
+    test_different_prompt_misses()
+    test_lru_eviction_and_persistence()
+    print("✓ All semantic cache tests passed")
@@ -0,0 +1,170 @@
+"""
+Test streamed API calls against a stubbed Anthropic client
+"""
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from brain_builder.researcher import BrainResearcher, ResearchSource
+from chat_system.brain_chat import BrainChat
+from chat_system.multi_brain_debate import DebateParticipant, MultiBrainDebate
+
+
+class StubStream:
+    """Context manager standing in for client.messages.stream(...)"""
+
+    def __init__(self, chunks, stop_reason="end_turn", error=None):
+        self.chunks = chunks
+        self.stop_reason = stop_reason
+        self.error = error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    @property
+    def text_stream(self):
+        yield from self.chunks
+        if self.error is not None:
+            raise self.error
+
+    def get_final_message(self):
+        return SimpleNamespace(stop_reason=self.stop_reason)
+
+
+class StubClient:
+    """Client whose messages.stream(**request) returns respond(request)"""
+
+    def __init__(self, respond):
+        self.requests = []
+
+        def stream(**request):
+            self.requests.append(request)
+            return respond(request)
+
+        self.messages = SimpleNamespace(stream=stream)
+
+
+class ListHandler(logging.Handler):
+    """Collects log records"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_truncated_source_reply_is_logged():
+    """A reply cut off at max_tokens logs a warning and falls back to empty insights"""
+    client = StubClient(lambda request: StubStream(['{"philosophy": ["Fear is'], stop_reason="max_tokens"))
+    researcher = BrainResearcher(api_key="test", client=client, latency_mode="optimized")
+    source = ResearchSource(url="u", title="Interview", source_type="interview", content="...")
+
+    handler = ListHandler()
+    logger = logging.getLogger("brain_builder.researcher")
+    logger.addHandler(handler)
+    try:
+        insights = researcher._extract_insights_from_source("Test Director", source)
+    finally:
+        logger.removeHandler(handler)
+
+    request = client.requests[0]
+    assert request["max_tokens"] == 1200
+    assert "service_tier" not in request
+    assert insights["philosophy"] == []
+    assert [r.levelno for r in handler.records] == [logging.WARNING]
+    assert "max_tokens=1200" in handler.records[0].getMessage()
+
+
+def test_complete_source_reply_is_not_flagged():
+    """A reply whose JSON closes is parsed and nothing is logged"""
+    client = StubClient(lambda request: StubStream(['{"philosophy": ', '["Fear is social"]}', " Hope this helps!"]))
+    researcher = BrainResearcher(api_key="test", client=client)
+    source = ResearchSource(url="u", title="Interview", source_type="interview", content="...")
+
+    handler = ListHandler()
+    logger = logging.getLogger("brain_builder.researcher")
+    logger.addHandler(handler)
+    try:
+        insights = researcher._extract_insights_from_source("Test Director", source)
+    finally:
+        logger.removeHandler(handler)
+
+    assert client.requests[0]["max_tokens"] == 2000
+    assert insights == {"philosophy": ["Fear is social"]}
+    assert handler.records == []
+
+
+def test_chat_stream_rolls_back_on_error():
+    """A stream that fails part way leaves the session history as it was"""
+    chat = BrainChat(api_key="test")
+    session = chat.start_chat("Test Director", "Persona document")
+
+    chat.client = StubClient(lambda request: StubStream(["Hello"]))
+    assert "".join(chat.send_message_stream(session, "First question")) == "Hello"
+    assert [m.role for m in session.messages] == ["user", "assistant"]
+
+    chat.client = StubClient(lambda request: StubStream(["Partial"], error=ConnectionError("dropped")))
+    received = []
+    try:
+        for text in chat.send_message_stream(session, "Second question"):
+            received.append(text)
+    except ConnectionError:
+        pass
+    else:
+        raise AssertionError("stream error was swallowed")
+
+    assert received == ["Partial"]
+    assert [m.content for m in session.messages] == ["First question", "Hello"]
+    assert len(session.api_messages) == len(session.history_parts) == 2
+
+
+def test_debate_rounds_keep_participant_order():
+    """Concurrent replies are added in participant order, round by round"""
+
+    def respond(request):
+        system_text = "".join(block["text"] for block in request["system"])
+        speaker = "A" if "PERSONA-A" in system_text else "B"
+        round_num = request["messages"][0]["content"].count(f"reply from {speaker}") + 1
+        if speaker == "A":
+            # A's reply finishes after B's in every round
+            time.sleep(0.05)
+        return StubStream([f"reply from {speaker} ", f"(round {round_num})"])
+
+    debate = MultiBrainDebate(api_key="test")
+    debate.client = StubClient(respond)
+    session = debate.start_debate(
+        topic="Does the opening work?",
+        participants=[
+            DebateParticipant(name="Brain A", persona="PERSONA-A"),
+            DebateParticipant(name="Brain B", persona="PERSONA-B"),
+        ]
+    )
+
+    asyncio.run(debate.facilitate_debate_async(session, rounds=2))
+
+    assert [(m.speaker, m.content) for m in session.messages] == [
+        ("Brain A", "reply from A (round 1)"),
+        ("Brain B", "reply from B (round 1)"),
+        ("Brain A", "reply from A (round 2)"),
+        ("Brain B", "reply from B (round 2)"),
+    ]
+
+
+if __name__ == "__main__":
+    test_truncated_source_reply_is_logged()
+    test_complete_source_reply_is_not_flagged()
+    test_chat_stream_rolls_back_on_error()
+    test_debate_rounds_keep_participant_order()
+    print("✓ All streaming tests passed")